@@ -19,22 +19,25 @@ def main():
         print("Each ping is 0.2s with 0.05s fade_out, spaced 0.5s apart")
         print()
 
+        # Only the frequency changes between pings
+        send_ping = mgr.compile_template({
+            "command": "patch",
+            "id": "ping",  # Same ID every time
+            "source": {
+                "kind": "waveform",
+                "waveform": "sine",
+                "frequency": "$freq",
+                "non_looping_duration": 0.2,
+                "fade_out": 0.05,
+            },
+            "volume": 0.3,
+        })
+
         for i in range(10):
             freq = 440 + (i * 50)  # Rising pitch
             print(f"Ping {i + 1}: {freq} Hz")
 
-            mgr.submit_command({
-                "command": "patch",
-                "id": "ping",  # Same ID every time
-                "source": {
-                    "kind": "waveform",
-                    "waveform": "sine",
-                    "frequency": freq,
-                    "non_looping_duration": 0.2,
-                    "fade_out": 0.05,
-                },
-                "volume": 0.3,
-            })
+            send_ping(freq=freq)
 
             time.sleep(0.5)
 
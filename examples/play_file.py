@@ -20,6 +20,7 @@ Examples:
 WARNING: This will play audio!
 """
 
+import mmap
 import time
 from pathlib import Path
 import sys
@@ -27,14 +28,23 @@ import sys
 from fa_launcher_audio import AudioManager
 
 
-def data_provider(name: str) -> bytes:
-    """Load audio file from disk."""
+def data_provider(name: str) -> mmap.mmap:
+    """
+    Map an audio file from disk.
+
+    The decoder accepts any buffer, so a read-only mmap lets the OS page the
+    file in as it is decoded instead of copying all of it into memory first.
+    """
     # Look for files relative to the project root
     project_root = Path(__file__).parent.parent
     file_path = project_root / name
-    if file_path.exists():
-        return file_path.read_bytes()
-    raise FileNotFoundError(f"Audio file not found: {name}")
+    try:
+        f = open(file_path, "rb")
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Audio file not found: {name}") from None
+    with f:
+        # The mapping stays valid after the file is closed
+        return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
 
 
 def main():
@@ -41,29 +41,36 @@ def main():
     fade_time = 0.05
     volume = 0.3
 
+    # Each note starts at a fixed multiple of the note spacing.  Computing
+    # start times directly (rather than accumulating) keeps timing exact for
+    # long scores.
+    spacing = note_duration + gap
+    melody_freqs = tuple(NOTES[note] for note in melody)
+    source_template = {
+        "kind": "waveform",
+        "waveform": "triangle",
+        "non_looping_duration": note_duration,
+        "fade_out": fade_time,
+    }
+    command_template = {
+        "command": "patch",
+        "volume": volume,
+        "looping": False,
+        "playback_rate": 1.0,
+    }
+
     # Build patch commands with start_time for each note
-    commands = []
-    current_time = 0.0
-
-    for i, note in enumerate(melody):
-        commands.append({
-            "command": "patch",
-            "id": f"note_{i}",
-            "start_time": current_time,
-            "source": {
-                "kind": "waveform",
-                "waveform": "triangle",
-                "frequency": NOTES[note],
-                "non_looping_duration": note_duration,
-                "fade_out": fade_time,
-            },
-            "volume": volume,
-            "looping": False,
-            "playback_rate": 1.0,
-        })
-        current_time += note_duration + gap
-
-    total_duration = current_time + 0.5  # Add a little buffer at the end
+    commands = [
+        dict(
+            command_template,
+            id=f"note_{i}",
+            start_time=i * spacing,
+            source=dict(source_template, frequency=freq),
+        )
+        for i, freq in enumerate(melody_freqs)
+    ]
+
+    total_duration = len(melody) * spacing + 0.5  # Add a little buffer at the end
 
     with AudioManager(data_provider=data_provider) as mgr:
         try:
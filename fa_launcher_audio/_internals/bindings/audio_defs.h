@@ -38,12 +38,12 @@ typedef struct ma_decoder { ...; } ma_decoder;
 typedef struct ma_waveform { ...; } ma_waveform;
 typedef struct ma_gainer { ...; } ma_gainer;
 typedef struct ma_audio_buffer { ...; } ma_audio_buffer;
-typedef struct ma_audio_buffer_ref { ...; } ma_audio_buffer_ref;
+typedef struct ma_audio_buffer_ref { ma_uint32 sampleRate; ...; } ma_audio_buffer_ref;
 
 /* Config structures - also opaque */
 typedef struct ma_engine_config { ...; } ma_engine_config;
 typedef struct ma_decoder_config { ...; } ma_decoder_config;
-typedef struct ma_waveform_config { ...; } ma_waveform_config;
+typedef struct ma_waveform_config { double amplitude; double frequency; ...; } ma_waveform_config;
 typedef struct ma_gainer_config { ...; } ma_gainer_config;
 typedef struct ma_audio_buffer_config { ...; } ma_audio_buffer_config;
 
@@ -232,9 +232,25 @@ typedef struct panner_node { ...; } panner_node;
 
 ma_result panner_node_init(ma_node_graph* pNodeGraph, float initial_pan, void* pAllocationCallbacks, panner_node* pPanner);
 void panner_node_uninit(panner_node* pPanner, void* pAllocationCallbacks);
+void panner_node_reset(panner_node* pPanner, float pan);
 void panner_node_set_pan(panner_node* pPanner, float pan);
+void panner_node_set_blend(panner_node* pUnfiltered, panner_node* pFiltered, float filter_gain);
 float panner_node_get_pan(const panner_node* pPanner);
 
+/* Custom sine oscillator - trig-free replacement for ma_waveform's sine */
+typedef struct sine_osc { ...; } sine_osc;
+
+ma_result sine_osc_init(ma_uint32 sample_rate, double frequency, double amplitude, sine_osc* pOsc);
+void sine_osc_uninit(sine_osc* pOsc);
+ma_result sine_osc_read_pcm_frames(sine_osc* pOsc, void* pFramesOut, ma_uint64 frameCount, ma_uint64* pFramesRead);
+ma_result sine_osc_seek_to_pcm_frame(sine_osc* pOsc, ma_uint64 frameIndex);
+ma_result sine_osc_set_frequency(sine_osc* pOsc, double frequency);
+ma_result sine_osc_set_amplitude(sine_osc* pOsc, double amplitude);
+
+/* Batch end-of-playback check over many sounds */
+ma_uint32 sound_poll_finished(ma_sound** ppSounds, ma_uint32 count, ma_uint32* pFinishedOut);
+ma_bool32 sound_poll_source_reached(void* pDataSource, ma_uint64 endFrame);
+
 /* Low-pass filter node */
 typedef struct ma_lpf_node { ...; } ma_lpf_node;
 typedef struct ma_lpf_node_config { ...; } ma_lpf_node_config;
@@ -247,3 +263,7 @@ void ma_lpf_node_uninit(ma_lpf_node* pNode, void* pAllocationCallbacks);
 
 ma_lpf_config ma_lpf_config_init(ma_format format, ma_uint32 channels, ma_uint32 sampleRate, double cutoffFrequency, ma_uint32 order);
 
+/* Wiring a sound's output path in one call */
+ma_result sound_graph_attach(ma_sound* pSound, panner_node* pPanner, ma_node* pEndpoint);
+ma_result sound_graph_attach_lpf(ma_sound* pSound, ma_splitter_node* pSplitter, ma_lpf_node* pLpf, panner_node* pPanner, panner_node* pPannerFiltered, ma_node* pEndpoint);
+void sound_graph_set_initial_volume(ma_sound* pSound, float volume);
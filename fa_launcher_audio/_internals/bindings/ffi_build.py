@@ -10,11 +10,17 @@ from pathlib import Path
 
 ffibuilder = FFI()
 
-# Release mode flags
+# Release mode flags.
+#
+# We deliberately avoid -march=native and -ffast-math: wheels must run on
+# machines other than the one that built them, and fast-math changes NaN and
+# denormal handling for the whole process.  miniaudio and the dr_libs
+# already compile their SSE2/AVX2/NEON kernels in and select them at runtime
+# via CPUID, so no target flags are needed to reach them.
 if sys.platform == "win32":
     extra_compile_args = ["/O2", "/DNDEBUG"]
 else:
-    extra_compile_args = ["-O2", "-DNDEBUG"]
+    extra_compile_args = ["-O3", "-DNDEBUG"]
 
 # Get paths
 this_dir = Path(__file__).parent.resolve()
@@ -53,6 +59,15 @@ source_code = '''
 
 /* Custom panner node - must come after miniaudio */
 #include "panner_node.c"
+
+/* Custom sine oscillator - must come after miniaudio */
+#include "sine_osc.c"
+
+/* Batch sound polling for the worker - must come after miniaudio */
+#include "sound_poll.c"
+
+/* Sound graph wiring - must come after miniaudio and the panner node */
+#include "sound_graph.c"
 '''
 
 ffibuilder.set_source(
@@ -1,21 +1,120 @@
 """Byte caching for audio data."""
 
-from typing import Callable
+import threading
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Callable
+
+if TYPE_CHECKING:
+    from fa_launcher_audio._internals.sources import DecodedPcm
+
+# Default cache budget: 64 MiB of encoded audio
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+
+# Default budget for decoded audio: 128 MiB, about 12 minutes of mono
+# float32 at 44.1 kHz
+DEFAULT_MAX_PCM_BYTES = 128 * 1024 * 1024
 
 
 class BytesCache:
-    """Cache for loaded audio bytes."""
+    """
+    Least-recently-used cache for loaded audio bytes, bounded by total size.
+
+    Once the cached bytes exceed max_bytes, the least recently used entries are
+    evicted.  An entry bigger than the whole budget is returned but not kept.
+    Safe to use from more than one thread.
+    """
 
-    def __init__(self, data_provider: Callable[[str], bytes]):
+    def __init__(
+        self,
+        data_provider: Callable[[str], bytes],
+        max_bytes: int = DEFAULT_MAX_BYTES,
+    ):
         self._data_provider = data_provider
-        self._cache: dict[str, bytes] = {}
+        self._max_bytes = max_bytes
+        self._cache: OrderedDict[str, bytes] = OrderedDict()
+        self._total_bytes = 0
+        # The worker and the preload thread (see CommandWorker.preload) both read
+        self._lock = threading.Lock()
 
     def get(self, name: str) -> bytes:
         """Get bytes for a name, loading and caching if not already cached."""
-        if name not in self._cache:
-            self._cache[name] = self._data_provider(name)
-        return self._cache[name]
+        with self._lock:
+            data = self._cache.get(name)
+            if data is not None:
+                self._cache.move_to_end(name)
+                return data
+
+        # Load outside the lock, so a slow load doesn't hold up other threads
+        data = self._data_provider(name)
+        if len(data) > self._max_bytes:
+            # Keeping it would evict everything else before evicting it too
+            return data
+        with self._lock:
+            previous = self._cache.pop(name, None)
+            if previous is not None:
+                self._total_bytes -= len(previous)
+            self._cache[name] = data
+            self._total_bytes += len(data)
+            while self._total_bytes > self._max_bytes:
+                _, evicted = self._cache.popitem(last=False)
+                self._total_bytes -= len(evicted)
+        return data
+
+    def discard(self, name: str) -> None:
+        """Drop one entry, if cached."""
+        with self._lock:
+            data = self._cache.pop(name, None)
+            if data is not None:
+                self._total_bytes -= len(data)
+
+    def clear(self) -> None:
+        """Clear the cache."""
+        with self._lock:
+            self._cache.clear()
+            self._total_bytes = 0
+
+
+class PcmCache:
+    """
+    Least-recently-used cache for decoded audio, bounded by total size.
+
+    Every sound playing the same name shares one DecodedPcm, so a sound that
+    plays many times is decoded once.  Evicting an entry doesn't free it while
+    sounds are still playing it; they hold their own reference.  An entry
+    bigger than the whole budget is not kept.
+
+    Decoding happens elsewhere (see CommandWorker), so get is only a lookup.
+    Only the worker thread uses it.
+    """
+
+    def __init__(self, max_bytes: int = DEFAULT_MAX_PCM_BYTES):
+        self._max_bytes = max_bytes
+        self._cache: OrderedDict[str, "DecodedPcm"] = OrderedDict()
+        self._total_bytes = 0
+
+    def get(self, name: str) -> "DecodedPcm | None":
+        """Get decoded audio for a name, or None if not cached."""
+        pcm = self._cache.get(name)
+        if pcm is not None:
+            self._cache.move_to_end(name)
+        return pcm
+
+    def put(self, name: str, pcm: "DecodedPcm") -> bool:
+        """Store decoded audio as most recently used.  False if it doesn't fit at all."""
+        if pcm.nbytes > self._max_bytes:
+            # Keeping it would evict everything else before evicting it too
+            return False
+        previous = self._cache.pop(name, None)
+        if previous is not None:
+            self._total_bytes -= previous.nbytes
+        self._cache[name] = pcm
+        self._total_bytes += pcm.nbytes
+        while self._total_bytes > self._max_bytes:
+            _, evicted = self._cache.popitem(last=False)
+            self._total_bytes -= evicted.nbytes
+        return True
 
     def clear(self) -> None:
         """Clear the cache."""
         self._cache.clear()
+        self._total_bytes = 0
@@ -1,8 +1,9 @@
 """JSON command parsing for the audio system."""
 
+import functools
 import json
 from dataclasses import dataclass
-from typing import Literal
+from typing import ClassVar, Iterator, Literal
 
 from fa_launcher_audio._internals.parameters import (
     VolumeParams,
@@ -10,15 +11,26 @@ from fa_launcher_audio._internals.parameters import (
     parse_param,
 )
 
+# orjson is optional; it is considerably faster than the stdlib for the
+# small command documents we receive, but we don't require it.
+try:
+    import orjson
 
-@dataclass
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+
+@dataclass(frozen=True, slots=True)
 class StopCommand:
     """Command to stop a sound."""
 
+    KIND: ClassVar[int] = 0
+
     id: str
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class LpfConfig:
     """Configuration for low-pass filter."""
 
@@ -26,7 +38,7 @@ class LpfConfig:
     enabled: bool  # Whether the filter is active
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class SourceConfig:
     """Configuration for a sound source."""
 
@@ -40,10 +52,12 @@ class SourceConfig:
     fade_out: float | None = None  # Fade out duration in seconds (waveform only)
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class PatchCommand:
     """Command to create or update a sound."""
 
+    KIND: ClassVar[int] = 1
+
     id: str
     source: SourceConfig
     volume_params: VolumeParams
@@ -54,20 +68,27 @@ class PatchCommand:
     filter_gain: Parameter | None = None  # 0.0 = unfiltered, 1.0 = filtered (only when lpf present)
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class CompoundCommand:
     """Command containing multiple sub-commands to execute together."""
 
-    commands: list["Command"]
+    KIND: ClassVar[int] = 2
+
+    commands: tuple["Command", ...]
 
 
 Command = StopCommand | PatchCommand | CompoundCommand
+# Each Command class has a distinct KIND, 0..2, so consumers can dispatch
+# with a tuple index instead of isinstance checks.
+
+
+_SOURCE_KINDS = frozenset({"encoded_bytes", "waveform"})
 
 
 def parse_source(source_dict: dict) -> SourceConfig:
     """Parse source configuration from JSON."""
     kind = source_dict.get("kind")
-    if kind not in ("encoded_bytes", "waveform"):
+    if kind not in _SOURCE_KINDS:
         raise ValueError(f"Unknown source kind: {kind}")
 
     return SourceConfig(
@@ -91,52 +112,127 @@ def parse_lpf(lpf_dict: dict | None) -> LpfConfig | None:
     )
 
 
-def parse_command(json_data: str | dict) -> Command:
+# Strings longer than this are parsed without memoization; big documents are
+# unlikely to repeat and would crowd out the short ones that do.
+_PARSE_CACHE_MAX_LENGTH = 4096
+
+
+def parse_command(json_data: str | bytes | dict) -> Command:
     """
     Parse a JSON command into a Command object.
 
+    Identical short JSON strings are memoized, since callers tend to reissue
+    the same command (UI beeps, event sounds) many times.  Commands are frozen
+    so a cached instance can be safely shared.
+
     Args:
-        json_data: JSON string or already-parsed dict
+        json_data: JSON string, UTF-8 encoded JSON bytes, or already-parsed
+                   dict.  Bytes skip decoding to str when orjson is available.
 
     Returns:
         StopCommand, PatchCommand, or CompoundCommand
     """
-    if isinstance(json_data, str):
-        data = json.loads(json_data)
-    else:
-        data = json_data
+    if isinstance(json_data, (str, bytes)):
+        if len(json_data) < _PARSE_CACHE_MAX_LENGTH:
+            return _parse_command_cached(json_data)
+        return _parse_dict(_json_loads(json_data))
 
+    return _parse_dict(json_data)
+
+
+@functools.lru_cache(maxsize=512)
+def _parse_command_cached(json_str: str | bytes) -> Command:
+    """Parse a JSON string, caching the result."""
+    return _parse_dict(_json_loads(json_str))
+
+
+def _parse_dict(data: dict) -> Command:
+    """Parse an already-decoded command dict."""
+    if data.get("command") == "compound":
+        return _parse_compound(data)
+    return _parse_leaf(data)
+
+
+def _parse_leaf(data: dict) -> StopCommand | PatchCommand:
+    """Parse a stop or patch command dict."""
     command_type = data.get("command")
+    parser = _LEAF_PARSERS.get(command_type)
+    if parser is None:
+        raise ValueError(f"Unknown command type: {command_type}")
+    return parser(data)
+
+
+def _parse_stop(data: dict) -> StopCommand:
+    """Parse a stop command dict."""
+    return StopCommand(id=data["id"])
+
+
+def _parse_patch(data: dict) -> PatchCommand:
+    """Parse a patch command dict."""
+    # Pull every field out in one pass, then build from the raw values
+    get = data.get
+    volume = get("volume", 1.0)
+    pan = get("pan", 0.0)
+    playback_rate = get("playback_rate", 1.0)
+
+    lpf = parse_lpf(get("lpf"))
+    # Strip lpf if not enabled (it's immutable, so no point creating infrastructure)
+    if lpf is not None and not lpf.enabled:
+        lpf = None
+    # filter_gain only meaningful when lpf is present and enabled
+    filter_gain = None
+    if lpf is not None:
+        filter_gain = parse_param(get("filter_gain", 1.0))
+
+    return PatchCommand(
+        id=data["id"],
+        source=parse_source(data["source"]),
+        volume_params=VolumeParams.from_values(volume, pan),
+        looping=get("looping", False),
+        playback_rate=parse_param(playback_rate),
+        start_time=float(get("start_time", 0.0)),
+        lpf=lpf,
+        filter_gain=filter_gain,
+    )
+
+
+# Parsers for the non-compound command types, keyed by the "command" field
+_LEAF_PARSERS = {
+    "stop": _parse_stop,
+    "patch": _parse_patch,
+}
 
-    if command_type == "stop":
-        return StopCommand(id=data["id"])
-
-    if command_type == "patch":
-        lpf = parse_lpf(data.get("lpf"))
-        # Strip lpf if not enabled (it's immutable, so no point creating infrastructure)
-        if lpf is not None and not lpf.enabled:
-            lpf = None
-        # filter_gain only meaningful when lpf is present and enabled
-        filter_gain = None
-        if lpf is not None:
-            filter_gain = parse_param(data.get("filter_gain", 1.0))
-
-        return PatchCommand(
-            id=data["id"],
-            source=parse_source(data["source"]),
-            volume_params=VolumeParams.from_dict(data),
-            looping=data.get("looping", False),
-            playback_rate=parse_param(data.get("playback_rate", 1.0)),
-            start_time=float(data.get("start_time", 0.0)),
-            lpf=lpf,
-            filter_gain=filter_gain,
-        )
-
-    if command_type == "compound":
-        sub_commands = [parse_command(cmd) for cmd in data.get("commands", [])]
-        return CompoundCommand(commands=sub_commands)
-
-    raise ValueError(f"Unknown command type: {command_type}")
+
+def _parse_compound(data: dict) -> CompoundCommand:
+    """
+    Parse a compound command dict without recursing.
+
+    Nested compounds are kept as nested CompoundCommands.  Each stack entry is
+    the iterator over a compound's sub-commands plus the commands parsed
+    from it so far; a compound is built once its iterator is exhausted.
+    Sub-commands may be dicts or JSON strings/bytes, like parse_command.
+    """
+    stack = [(iter(data.get("commands", [])), [])]
+    while True:
+        pending, parsed = stack[-1]
+        sub = next(pending, _END)
+        if sub is _END:
+            stack.pop()
+            compound = CompoundCommand(commands=tuple(parsed))
+            if not stack:
+                return compound
+            stack[-1][1].append(compound)
+            continue
+        if isinstance(sub, (str, bytes)):
+            sub = _json_loads(sub)
+        if sub.get("command") == "compound":
+            stack.append((iter(sub.get("commands", [])), []))
+        else:
+            parsed.append(_parse_leaf(sub))
+
+
+# Sentinel marking an exhausted sub-command iterator in _parse_compound
+_END = object()
 
 
 def validate_command(cmd: Command) -> list[str]:
@@ -145,50 +241,106 @@ def validate_command(cmd: Command) -> list[str]:
 
     Returns empty list if valid.
     """
-    errors = []
-
-    if isinstance(cmd, PatchCommand):
-        if not cmd.id:
-            errors.append("Patch command missing id")
-
-        if cmd.start_time < 0:
-            errors.append("start_time cannot be negative")
-
-        src = cmd.source
-        if src.kind == "encoded_bytes":
-            if not src.name:
-                errors.append("encoded_bytes source missing name")
-
-        elif src.kind == "waveform":
-            if not src.waveform:
-                errors.append("waveform source missing waveform type")
-            if src.frequency is None:
-                errors.append("waveform source missing frequency")
-            if src.waveform and src.waveform not in ("sine", "square", "triangle", "saw"):
-                errors.append(f"Unknown waveform type: {src.waveform}")
-            if src.fade_out is not None:
-                if src.fade_out < 0:
-                    errors.append("fade_out cannot be negative")
-                if src.non_looping_duration is not None and src.fade_out > src.non_looping_duration:
-                    errors.append("fade_out exceeds duration")
-
-        # Validate lpf config
-        if cmd.lpf is not None:
-            if cmd.lpf.cutoff <= 0:
-                errors.append("lpf cutoff must be positive")
-            if cmd.lpf.cutoff > 20000:
-                errors.append("lpf cutoff exceeds audible range (20kHz)")
-
-    elif isinstance(cmd, StopCommand):
-        if not cmd.id:
-            errors.append("Stop command missing id")
-
-    elif isinstance(cmd, CompoundCommand):
-        if not cmd.commands:
-            errors.append("Compound command has no sub-commands")
-        for i, sub_cmd in enumerate(cmd.commands):
-            sub_errors = validate_command(sub_cmd)
-            for err in sub_errors:
-                errors.append(f"sub-command {i}: {err}")
-
-    return errors
+    return list(_iter_errors(cmd))
+
+
+def validate_command_fast(cmd: Command) -> bool:
+    """
+    Check whether a parsed command is valid.
+
+    Stops at the first problem and never formats messages for the rest, so
+    this is the one to use on the submission path.  Use validate_command to
+    find out what is wrong.
+    """
+    return next(_iter_errors(cmd), None) is None
+
+
+def prepare_command(json_data: str | bytes | dict) -> Command:
+    """
+    Parse and validate a command, raising ValueError if it is invalid.
+
+    The result can be submitted any number of times and skips both steps
+    on the worker.
+    """
+    cmd = parse_command(json_data)
+    if not validate_command_fast(cmd):
+        raise ValueError(f"Command validation errors: {validate_command(cmd)}")
+    return cmd
+
+
+def _iter_errors(cmd: Command) -> Iterator[str]:
+    """
+    Lazily yield validation errors for a command and any sub-commands.
+
+    Walks compounds with an explicit stack (they may nest deeply) in the same
+    order as the sub-commands appear.  Each entry carries the path of
+    sub-command indices, which only becomes a prefix string if an error is
+    actually reported.
+    """
+    stack: list[tuple[tuple[int, ...], Command]] = [((), cmd)]
+    while stack:
+        path, cmd = stack.pop()
+        cmd_type = type(cmd)
+        for err in _ERROR_CHECKS[cmd_type](cmd):
+            if path:
+                err = "".join(f"sub-command {i}: " for i in path) + err
+            yield err
+        if cmd_type is CompoundCommand:
+            stack.extend(
+                (path + (i,), sub_cmd)
+                for i, sub_cmd in reversed(list(enumerate(cmd.commands)))
+            )
+
+
+def _patch_errors(cmd: PatchCommand) -> Iterator[str]:
+    """Yield errors for a patch command."""
+    if not cmd.id:
+        yield "Patch command missing id"
+
+    if cmd.start_time < 0:
+        yield "start_time cannot be negative"
+
+    src = cmd.source
+    if src.kind == "encoded_bytes":
+        if not src.name:
+            yield "encoded_bytes source missing name"
+
+    elif src.kind == "waveform":
+        if not src.waveform:
+            yield "waveform source missing waveform type"
+        if src.frequency is None:
+            yield "waveform source missing frequency"
+        if src.waveform and src.waveform not in ("sine", "square", "triangle", "saw"):
+            yield f"Unknown waveform type: {src.waveform}"
+        if src.fade_out is not None:
+            if src.fade_out < 0:
+                yield "fade_out cannot be negative"
+            if src.non_looping_duration is not None and src.fade_out > src.non_looping_duration:
+                yield "fade_out exceeds duration"
+
+    # Validate lpf config
+    if cmd.lpf is not None:
+        if cmd.lpf.cutoff <= 0:
+            yield "lpf cutoff must be positive"
+        if cmd.lpf.cutoff > 20000:
+            yield "lpf cutoff exceeds audible range (20kHz)"
+
+
+def _stop_errors(cmd: StopCommand) -> Iterator[str]:
+    """Yield errors for a stop command."""
+    if not cmd.id:
+        yield "Stop command missing id"
+
+
+def _compound_errors(cmd: CompoundCommand) -> Iterator[str]:
+    """Yield errors for a compound command itself, not its sub-commands."""
+    if not cmd.commands:
+        yield "Compound command has no sub-commands"
+
+
+# Per-type error checks; _iter_errors handles descending into compounds
+_ERROR_CHECKS = {
+    PatchCommand: _patch_errors,
+    StopCommand: _stop_errors,
+    CompoundCommand: _compound_errors,
+}
@@ -7,13 +7,18 @@ class MiniaudioError(Exception):
     """Exception raised for miniaudio errors."""
 
     def __init__(self, result: int, message: str = ""):
+        super().__init__(result, message)
         self.result = result
-        super().__init__(f"Miniaudio error {result}: {message}")
+        self.message = message
+
+    def __str__(self) -> str:
+        # Formatted on demand; callers that catch and retry never pay for it
+        return f"Miniaudio error {self.result}: {self.message}"
 
 
 def _check_result(result: int, message: str = "") -> None:
     """Raise MiniaudioError if result is not MA_SUCCESS (0)."""
-    if result != 0:
+    if result:
         raise MiniaudioError(result, message)
 
 
@@ -38,6 +43,15 @@ class MiniaudioEngine:
         self._initialized = False
         self._no_device = no_device
 
+        # Scratch space for read_frames, grown on demand and reused
+        self._read_buf = None
+        self._read_buf_frames = 0
+        self._frames_read_out = ffi.new("ma_uint64*")
+
+        # Detached, still-initialized panner nodes that finished sounds hand
+        # back for reuse (see Sound), saving a node init/uninit per sound
+        self._panner_pool = []
+
         # Get default config
         config = lib.ma_engine_config_init()
 
@@ -50,10 +64,14 @@ class MiniaudioEngine:
         _check_result(result, "Failed to initialize engine")
         self._initialized = True
 
+        # The sample rate is fixed once the engine exists, so look it up once
+        self._sample_rate = lib.ma_engine_get_sample_rate(self._engine)
+        self._inv_sample_rate = 1.0 / self._sample_rate
+
     @property
     def sample_rate(self) -> int:
         """Get the engine's sample rate."""
-        return lib.ma_engine_get_sample_rate(self._engine)
+        return self._sample_rate
 
     def get_time_frames(self) -> int:
         """Get current engine time in PCM frames."""
@@ -61,7 +79,7 @@ class MiniaudioEngine:
 
     def get_time_seconds(self) -> float:
         """Get current engine time in seconds."""
-        return self.get_time_frames() / self.sample_rate
+        return lib.ma_engine_get_time_in_pcm_frames(self._engine) * self._inv_sample_rate
 
     def set_volume(self, volume: float) -> None:
         """Set master volume (0.0 to 1.0+)."""
@@ -83,22 +101,27 @@ class MiniaudioEngine:
 
         Returns raw PCM data as bytes (float32, stereo interleaved).
         """
-        # Allocate buffer for float32 stereo frames
-        buffer = ffi.new(f"float[{frame_count * self.CHANNELS}]")
-        frames_read = ffi.new("ma_uint64*")
+        # Grow the float32 stereo scratch buffer geometrically if needed
+        if frame_count > self._read_buf_frames:
+            self._read_buf_frames = max(frame_count, self._read_buf_frames * 2)
+            self._read_buf = ffi.new(f"float[{self._read_buf_frames * self.CHANNELS}]")
+        frames_read = self._frames_read_out
 
         result = lib.ma_engine_read_pcm_frames(
-            self._engine, buffer, frame_count, frames_read
+            self._engine, self._read_buf, frame_count, frames_read
         )
         _check_result(result, "Failed to read PCM frames")
 
-        # Convert to bytes
+        # Copy out to bytes; the scratch buffer is reused by the next call
         actual_samples = int(frames_read[0]) * self.CHANNELS
-        return ffi.buffer(buffer, actual_samples * 4)[:]
+        return ffi.buffer(self._read_buf, actual_samples * 4)[:]
 
     def uninit(self) -> None:
         """Clean up engine resources."""
         if self._initialized:
+            for panner in self._panner_pool:
+                lib.panner_node_uninit(panner, ffi.NULL)
+            self._panner_pool.clear()
             lib.ma_engine_uninit(self._engine)
             self._initialized = False
 
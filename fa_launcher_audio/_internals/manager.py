@@ -1,10 +1,12 @@
 """AudioManager - main public interface."""
 
-import json
+from concurrent.futures import Future
 from typing import Callable
 
-from fa_launcher_audio._internals.cache import BytesCache
+from fa_launcher_audio._internals.cache import BytesCache, DEFAULT_MAX_BYTES, DEFAULT_MAX_PCM_BYTES
+from fa_launcher_audio._internals.commands import Command, prepare_command
 from fa_launcher_audio._internals.engine import MiniaudioEngine
+from fa_launcher_audio._internals.templates import compile_template
 from fa_launcher_audio._internals.worker import CommandWorker
 
 
@@ -17,6 +19,9 @@ class _NoCacheWrapper:
     def get(self, name: str) -> bytes:
         return self._data_provider(name)
 
+    def discard(self, name: str) -> None:
+        pass
+
     def clear(self) -> None:
         pass
 
@@ -45,6 +50,8 @@ class AudioManager:
         data_provider: Callable[[str], bytes],
         *,
         disable_cache: bool = False,
+        cache_max_bytes: int = DEFAULT_MAX_BYTES,
+        pcm_cache_max_bytes: int = DEFAULT_MAX_PCM_BYTES,
     ):
         """
         Initialize audio manager.
@@ -53,18 +60,26 @@ class AudioManager:
             data_provider: Callback that returns bytes for a given sound name.
             disable_cache: If True, bypass caching and call provider each time.
                            Useful when files may change during playback.
+            cache_max_bytes: Total size of audio bytes to keep cached. Least
+                             recently used sounds are evicted beyond this.
+            pcm_cache_max_bytes: Total size of decoded audio to keep cached,
+                                 shared by every sound playing it.  Least
+                                 recently used sounds are evicted beyond this.
         """
         if disable_cache:
             self._bytes_cache = _NoCacheWrapper(data_provider)
+            # Stream every play too, so changed files are picked up
+            self._pcm_cache_max_bytes = 0
         else:
-            self._bytes_cache = BytesCache(data_provider)
+            self._bytes_cache = BytesCache(data_provider, max_bytes=cache_max_bytes)
+            self._pcm_cache_max_bytes = pcm_cache_max_bytes
         self._engine: MiniaudioEngine | None = None
         self._worker: CommandWorker | None = None
 
     def __enter__(self) -> "AudioManager":
         """Start the engine and background worker."""
         self._engine = MiniaudioEngine()
-        self._worker = CommandWorker(self._engine, self._bytes_cache)
+        self._worker = CommandWorker(self._engine, self._bytes_cache, self._pcm_cache_max_bytes)
         self._worker.start()
         return self
 
@@ -77,22 +92,83 @@ class AudioManager:
             self._engine.uninit()
             self._engine = None
 
-    def submit_command(self, command: str | dict) -> None:
+    def submit_command(self, command: str | bytes | dict | Command) -> None:
         """
         Submit a JSON command for processing.
 
+        Dicts are handed to the worker as-is, without a JSON round-trip, so
+        don't mutate one after submitting it.
+
         Args:
-            command: JSON string or dict with command data.
-                     Commands: "stop", "patch"
+            command: JSON string (or UTF-8 bytes) or dict with command data.
+                     Commands: "stop", "patch", "compound".  Or a command
+                     returned by prepare_command.
         """
         if self._worker is None:
             raise RuntimeError("AudioManager not started. Use as context manager.")
 
-        if isinstance(command, dict):
-            command = json.dumps(command)
-
         self._worker.submit(command)
 
+    @staticmethod
+    def prepare_command(command: str | bytes | dict) -> Command:
+        """
+        Parse and validate a command once, for submitting many times.
+
+        Raises ValueError here, on the caller's thread, if the command is
+        invalid.  The worker runs the result as-is, skipping the parsing
+        and validation every other submit pays for.
+
+        Example:
+            click = AudioManager.prepare_command({
+                "command": "patch",
+                "id": "click",
+                "source": {"kind": "encoded_bytes", "name": "click.ogg"},
+            })
+            mgr.submit_command(click)
+        """
+        return prepare_command(command)
+
+    def preload(self, name: str) -> "Future[None]":
+        """
+        Load and decode a sound in the background, so its first play is quick.
+
+        Calls data_provider and decodes on a separate thread; the returned
+        future completes once the audio is decoded (or raises what loading
+        raised).  Playing the sound before then works as usual.  Has no
+        lasting effect with disable_cache.
+
+        Args:
+            name: Sound name, as used in encoded_bytes sources.
+        """
+        if self._worker is None:
+            raise RuntimeError("AudioManager not started. Use as context manager.")
+
+        return self._worker.preload(name)
+
+    def compile_template(self, template: dict) -> Callable[..., None]:
+        """
+        Compile a command template into a function that submits it.
+
+        String values of the form "$name" are slots, filled from keyword
+        arguments on each call.  Write "$$" for a literal leading "$"
+        ("$$coin.ogg" is the name "$coin.ogg").  Useful for commands that are
+        sent over and over with only a few fields changing.
+
+        Example:
+            send_ping = mgr.compile_template({
+                "command": "patch",
+                "id": "ping",
+                "source": {"kind": "waveform", "waveform": "sine", "frequency": "$freq"},
+            })
+            send_ping(freq=440)
+        """
+        fill = compile_template(template)
+
+        def submit(**values) -> None:
+            self.submit_command(fill(**values))
+
+        return submit
+
     @property
     def engine(self) -> MiniaudioEngine | None:
         """Get the underlying engine (for advanced use)."""
@@ -1,6 +1,7 @@
 """Parameter system for time-based value interpolation."""
 
-from dataclasses import dataclass
+from bisect import bisect_right
+from dataclasses import dataclass, field
 from typing import Literal, Protocol
 
 
@@ -16,7 +17,7 @@ class Parameter(Protocol):
         ...
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class TimePoint:
     """A value at a specific time for interpolation."""
 
@@ -28,6 +29,8 @@ class TimePoint:
 class StaticParam:
     """A constant parameter value."""
 
+    __slots__ = ("_value",)
+
     def __init__(self, value: float):
         self._value = value
 
@@ -41,6 +44,12 @@ class StaticParam:
         return f"StaticParam({self._value})"
 
 
+# Shared instances for the values nearly every command uses (default volume,
+# pan and playback rate).  StaticParam is immutable, so sharing is safe.  This
+# is a fixed table: caching arbitrary values would grow without bound.
+_COMMON_STATIC_PARAMS = {value: StaticParam(value) for value in (0.0, 0.5, 1.0)}
+
+
 class TimeEnvelope:
     """
     A parameter that interpolates between time points.
@@ -48,47 +57,86 @@ class TimeEnvelope:
     Supports linear interpolation and jump (step) interpolation.
     """
 
+    __slots__ = ("_times", "_values", "_is_jump", "_inv_dt", "_constant", "_cursor")
+
     def __init__(self, points: list[TimePoint]):
         if not points:
             raise ValueError("TimeEnvelope requires at least one point")
-        self._points = sorted(points, key=lambda p: p.time)
+        points = sorted(points, key=lambda p: p.time)
+
+        # Parallel arrays for get_value, so lookups are a bisect rather than a
+        # scan over TimePoint objects.  These stay lists rather than
+        # array('d'): indexing an array boxes a new float on every access,
+        # which makes bisect slower.  The TimePoints themselves aren't kept.
+        self._times = [p.time for p in points]
+        self._values = [p.value for p in points]
+        self._is_jump = bytes(p.interpolation == "jump" for p in points)
+        # 1 / duration of each segment; zero-length segments are never
+        # interpolated across, so their entry is unused
+        self._inv_dt = [
+            1.0 / (t2 - t1) if t2 > t1 else 0.0
+            for t1, t2 in zip(self._times, self._times[1:])
+        ]
+        # Points that all share one value interpolate to that value everywhere
+        self._constant = len(set(self._values)) == 1
+        # Segment found by the last get_value.  Queries mostly move forward
+        # through time, so it is checked before falling back to a bisect.  It
+        # is only a hint: envelopes can be shared between sounds.
+        self._cursor = 0
 
     def get_value(self, time_seconds: float) -> float:
         """Get interpolated value at the given time."""
-        if not self._points:
-            return 0.0
+        times = self._times
+        values = self._values
 
         # Before first point: return first value
-        if time_seconds <= self._points[0].time:
-            return self._points[0].value
+        if time_seconds <= times[0]:
+            return values[0]
 
         # After last point: return last value
-        if time_seconds >= self._points[-1].time:
-            return self._points[-1].value
-
-        # Find surrounding points
-        for i in range(len(self._points) - 1):
-            p1 = self._points[i]
-            p2 = self._points[i + 1]
-
-            if p1.time <= time_seconds < p2.time:
-                # Check interpolation type of the NEXT point
-                if p2.interpolation == "jump":
-                    # Hold previous value until we reach the next point
-                    return p1.value
-                else:  # linear
-                    # Linear interpolation
-                    t = (time_seconds - p1.time) / (p2.time - p1.time)
-                    return p1.value + t * (p2.value - p1.value)
-
-        # Fallback (shouldn't reach here)
-        return self._points[-1].value
+        if time_seconds >= times[-1]:
+            return values[-1]
+
+        # Find the segment with times[i] <= time_seconds < times[i + 1],
+        # trying the last segment and the one after it first
+        i = self._cursor
+        if not times[i] <= time_seconds < times[i + 1]:
+            if i + 2 < len(times) and times[i + 1] <= time_seconds < times[i + 2]:
+                i += 1
+            else:
+                i = bisect_right(times, time_seconds) - 1
+            self._cursor = i
+
+        # Check interpolation type of the NEXT point
+        if self._is_jump[i + 1]:
+            # Hold previous value until we reach the next point
+            return values[i]
+
+        # Linear interpolation
+        t = (time_seconds - times[i]) * self._inv_dt[i]
+        return values[i] + t * (values[i + 1] - values[i])
 
     def is_constant(self) -> bool:
-        return len(self._points) <= 1
+        return self._constant
+
+    def linear_ramp(self) -> tuple[float, float, float] | None:
+        """
+        Describe the envelope as a single linear ramp, if it is one.
+
+        Returns (start_value, end_value, duration_seconds) when the envelope
+        is one linear segment starting at time 0, otherwise None.
+        """
+        times = self._times
+        if len(times) != 2 or times[0] != 0.0 or times[1] <= 0.0 or self._is_jump[1]:
+            return None
+        return self._values[0], self._values[1], times[1]
 
     def __repr__(self) -> str:
-        return f"TimeEnvelope({self._points})"
+        points = [
+            TimePoint(time, value, "jump" if jump else "linear")
+            for time, value, jump in zip(self._times, self._values, self._is_jump)
+        ]
+        return f"TimeEnvelope({points})"
 
 
 def parse_param(value: float | int | list[dict]) -> StaticParam | TimeEnvelope:
@@ -103,7 +151,9 @@ def parse_param(value: float | int | list[dict]) -> StaticParam | TimeEnvelope:
         StaticParam or TimeEnvelope
     """
     if isinstance(value, (int, float)):
-        return StaticParam(float(value))
+        value = float(value)
+        param = _COMMON_STATIC_PARAMS.get(value)
+        return param if param is not None else StaticParam(value)
 
     if isinstance(value, list):
         points = []
@@ -119,12 +169,19 @@ def parse_param(value: float | int | list[dict]) -> StaticParam | TimeEnvelope:
     raise ValueError(f"Invalid parameter value: {value}")
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class VolumeParams:
     """Container for volume and pan parameters."""
 
     volume: Parameter
     pan: Parameter
+    # Computed once; the parameters are fixed for the object's lifetime
+    _constant: bool = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(
+            self, "_constant", self.volume.is_constant() and self.pan.is_constant()
+        )
 
     @classmethod
     def from_dict(cls, data: dict) -> "VolumeParams":
@@ -134,10 +191,16 @@ class VolumeParams:
         Args:
             data: Dict with "volume" (0.0-2.0+) and "pan" (-1.0 to +1.0)
         """
-        return cls(
-            volume=parse_param(data.get("volume", 1.0)),
-            pan=parse_param(data.get("pan", 0.0)),
-        )
+        return cls.from_values(data.get("volume", 1.0), data.get("pan", 0.0))
+
+    @classmethod
+    def from_values(
+        cls,
+        volume: float | int | list[dict],
+        pan: float | int | list[dict],
+    ) -> "VolumeParams":
+        """Parse volume/pan from JSON values already pulled out of a dict."""
+        return cls(volume=parse_param(volume), pan=parse_param(pan))
 
     def get_values(self, time_seconds: float) -> tuple[float, float]:
         """Get (volume, pan) values at the given time."""
@@ -148,4 +211,4 @@ class VolumeParams:
 
     def is_constant(self) -> bool:
         """True if all parameters are constant."""
-        return self.volume.is_constant() and self.pan.is_constant()
+        return self._constant
@@ -2,7 +2,7 @@
 
 from typing import TYPE_CHECKING
 from fa_launcher_audio._audio_cffi import ffi, lib
-from fa_launcher_audio._internals.engine import _check_result
+from fa_launcher_audio._internals.engine import MiniaudioError
 
 if TYPE_CHECKING:
     from fa_launcher_audio._internals.engine import MiniaudioEngine
@@ -17,10 +17,44 @@ _SOUND_FLAGS = (
 # Special value to keep sound output channel count matching data source
 _SOUND_SOURCE_CHANNEL_COUNT = lib.MA_SOUND_SOURCE_CHANNEL_COUNT
 
+# Pre-parsed pointer types, so per-sound allocations skip CFFI's type parsing
+_MA_SOUND_P = ffi.typeof("ma_sound*")
+_PANNER_NODE_P = ffi.typeof("panner_node*")
+_MA_SPLITTER_NODE_P = ffi.typeof("ma_splitter_node*")
+_MA_LPF_NODE_P = ffi.typeof("ma_lpf_node*")
+_NULL = ffi.NULL
+
+# Bound once: these run for every sound on every worker tick, and a module
+# global is cheaper to reach than an attribute of lib
+_ma_sound_is_playing = lib.ma_sound_is_playing
+_ma_sound_at_end = lib.ma_sound_at_end
+_ma_sound_set_pitch = lib.ma_sound_set_pitch
+_ma_sound_set_fade_in_pcm_frames = lib.ma_sound_set_fade_in_pcm_frames
+_panner_node_set_pan = lib.panner_node_set_pan
+
+# Most panners a single engine keeps around for reuse
+MAX_POOLED_PANNERS = 64
+
+# Released ma_sound buffers.  ma_sound_init_ex zeroes the struct itself, so a
+# buffer can go straight back into use once ma_sound_uninit has returned.
+_sound_buffers = []
+MAX_POOLED_SOUND_BUFFERS = 64
+
+# The same for the LPF path's nodes, whose init functions also zero them.
+# Unlike panners they are re-initialized each time, since the cutoff varies.
+_splitter_buffers = []
+_lpf_buffers = []
+MAX_POOLED_NODE_BUFFERS = 64
+
 # 50ms fade duration for smooth volume transitions (at 44100 Hz)
 FADE_DURATION_FRAMES = 2205
 
 
+def _node_state(running: bool) -> int:
+    """Map a running flag to an ma_node_state."""
+    return lib.ma_node_state_started if running else lib.ma_node_state_stopped
+
+
 class Sound:
     """
     A playable sound with volume, pitch, pan, looping, and optional LPF control.
@@ -35,6 +69,15 @@ class Sound:
     The blend between paths is controlled by filter_gain.
     """
 
+    __slots__ = (
+        "_id", "_engine", "_source", "_sound", "_panner", "_initialized",
+        "_panner_initialized", "_initial_pan", "_has_lpf", "_splitter",
+        "_lpf_node", "_panner_filtered", "_splitter_initialized",
+        "_lpf_initialized", "_panner_filtered_initialized", "_volume",
+        "_volume_on_bus", "_pan", "_pitch", "_looping", "_started",
+        "_filter_gain", "_unfiltered_running", "_filtered_running",
+    )
+
     def __init__(
         self,
         engine: "MiniaudioEngine",
@@ -56,11 +99,11 @@ class Sound:
         self._id = sound_id
         self._engine = engine
         self._source = source
-        self._sound = ffi.new("ma_sound*")
-        self._panner = ffi.new("panner_node*")
+        self._sound = _sound_buffers.pop() if _sound_buffers else ffi.new(_MA_SOUND_P)
+        self._panner = None
         self._initialized = False
         self._panner_initialized = False
-        self._initial_pan = max(-1.0, min(1.0, initial_pan))
+        self._initial_pan = initial_pan  # Clamped by the panner itself
 
         # LPF-related nodes (only used if lpf_cutoff is provided)
         self._has_lpf = lpf_cutoff is not None
@@ -80,7 +123,9 @@ class Sound:
         config.channelsOut = _SOUND_SOURCE_CHANNEL_COUNT
 
         result = lib.ma_sound_init_ex(engine._ptr, ffi.addressof(config), self._sound)
-        _check_result(result, f"Failed to initialize sound {sound_id}")
+        # Checked inline so error messages are only formatted on failure
+        if result:
+            raise MiniaudioError(result, f"Failed to initialize sound {sound_id}")
         self._initialized = True
 
         endpoint = lib.ma_engine_get_endpoint(engine._ptr)
@@ -89,78 +134,95 @@ class Sound:
         if self._has_lpf:
             # Dual-path routing with LPF
             # sound -> splitter -> [panner (unfiltered), lpf -> panner_filtered]
-            self._splitter = ffi.new("ma_splitter_node*")
-            self._lpf_node = ffi.new("ma_lpf_node*")
-            self._panner_filtered = ffi.new("panner_node*")
+            self._splitter = _splitter_buffers.pop() if _splitter_buffers else ffi.new(_MA_SPLITTER_NODE_P)
+            self._lpf_node = _lpf_buffers.pop() if _lpf_buffers else ffi.new(_MA_LPF_NODE_P)
 
             # Initialize splitter (mono, 2 outputs)
             splitter_config = lib.ma_splitter_node_config_init(1)  # 1 channel (mono)
-            result = lib.ma_splitter_node_init(node_graph, ffi.addressof(splitter_config), ffi.NULL, self._splitter)
-            _check_result(result, f"Failed to initialize splitter for sound {sound_id}")
+            result = lib.ma_splitter_node_init(node_graph, ffi.addressof(splitter_config), _NULL, self._splitter)
+            if result:
+                raise MiniaudioError(result, f"Failed to initialize splitter for sound {sound_id}")
             self._splitter_initialized = True
 
             # Initialize LPF node (mono, order 2 is a good default)
             sample_rate = lib.ma_engine_get_sample_rate(engine._ptr)
             lpf_config = lib.ma_lpf_node_config_init(1, sample_rate, lpf_cutoff, 2)
-            result = lib.ma_lpf_node_init(node_graph, ffi.addressof(lpf_config), ffi.NULL, self._lpf_node)
-            _check_result(result, f"Failed to initialize LPF for sound {sound_id}")
+            result = lib.ma_lpf_node_init(node_graph, ffi.addressof(lpf_config), _NULL, self._lpf_node)
+            if result:
+                raise MiniaudioError(result, f"Failed to initialize LPF for sound {sound_id}")
             self._lpf_initialized = True
 
             # Initialize unfiltered panner
-            result = lib.panner_node_init(node_graph, self._initial_pan, ffi.NULL, self._panner)
-            _check_result(result, f"Failed to initialize panner for sound {sound_id}")
+            self._panner = self._acquire_panner(node_graph, "panner")
             self._panner_initialized = True
 
             # Initialize filtered panner
-            result = lib.panner_node_init(node_graph, self._initial_pan, ffi.NULL, self._panner_filtered)
-            _check_result(result, f"Failed to initialize filtered panner for sound {sound_id}")
+            self._panner_filtered = self._acquire_panner(node_graph, "filtered panner")
             self._panner_filtered_initialized = True
 
-            # Wire: sound -> splitter
-            result = lib.ma_node_attach_output_bus(self._sound, 0, self._splitter, 0)
-            _check_result(result, f"Failed to attach sound to splitter for {sound_id}")
-
-            # Wire: splitter output 0 -> panner (unfiltered path)
-            result = lib.ma_node_attach_output_bus(self._splitter, 0, self._panner, 0)
-            _check_result(result, f"Failed to attach splitter to panner for {sound_id}")
-
-            # Wire: splitter output 1 -> lpf
-            result = lib.ma_node_attach_output_bus(self._splitter, 1, self._lpf_node, 0)
-            _check_result(result, f"Failed to attach splitter to LPF for {sound_id}")
-
-            # Wire: lpf -> panner_filtered
-            result = lib.ma_node_attach_output_bus(self._lpf_node, 0, self._panner_filtered, 0)
-            _check_result(result, f"Failed to attach LPF to filtered panner for {sound_id}")
-
-            # Wire: both panners -> endpoint
-            result = lib.ma_node_attach_output_bus(self._panner, 0, endpoint, 0)
-            _check_result(result, f"Failed to attach panner to endpoint for {sound_id}")
-
-            result = lib.ma_node_attach_output_bus(self._panner_filtered, 0, endpoint, 0)
-            _check_result(result, f"Failed to attach filtered panner to endpoint for {sound_id}")
+            # Wire all six edges in one call (see sound_graph.h)
+            result = lib.sound_graph_attach_lpf(
+                self._sound, self._splitter, self._lpf_node,
+                self._panner, self._panner_filtered, endpoint,
+            )
+            if result:
+                raise MiniaudioError(result, f"Failed to wire LPF graph for {sound_id}")
 
         else:
             # Simple single-path routing (no LPF)
             # sound (mono) -> panner (mono->stereo) -> endpoint
-            result = lib.panner_node_init(node_graph, self._initial_pan, ffi.NULL, self._panner)
-            _check_result(result, f"Failed to initialize panner for sound {sound_id}")
+            self._panner = self._acquire_panner(node_graph, "panner")
             self._panner_initialized = True
 
-            # Wire: sound -> panner
-            result = lib.ma_node_attach_output_bus(self._sound, 0, self._panner, 0)
-            _check_result(result, f"Failed to attach sound to panner for {sound_id}")
-
-            # Wire: panner -> endpoint
-            result = lib.ma_node_attach_output_bus(self._panner, 0, endpoint, 0)
-            _check_result(result, f"Failed to attach panner to endpoint for {sound_id}")
+            # Wire: sound -> panner -> endpoint
+            result = lib.sound_graph_attach(self._sound, self._panner, endpoint)
+            if result:
+                raise MiniaudioError(result, f"Failed to wire graph for {sound_id}")
 
         # Track parameters
         self._volume = 1.0
+        self._volume_on_bus = False
         self._pan = self._initial_pan
         self._pitch = 1.0
         self._looping = False
         self._started = False
         self._filter_gain = 1.0 if self._has_lpf else 0.0  # Default: full filter when LPF present
+        # Whether each LPF branch's panner is started (see set_filter_gain)
+        self._unfiltered_running = True
+        self._filtered_running = True
+
+    def _acquire_panner(self, node_graph, description: str):
+        """Take a panner from the engine's pool, or initialize a new one."""
+        pool = self._engine._panner_pool
+        if pool:
+            panner = pool.pop()
+            lib.panner_node_reset(panner, self._initial_pan)
+            return panner
+
+        panner = ffi.new(_PANNER_NODE_P)
+        result = lib.panner_node_init(node_graph, self._initial_pan, _NULL, panner)
+        if result:
+            raise MiniaudioError(result, f"Failed to initialize {description} for sound {self._id}")
+        return panner
+
+    def _release_panner(self, panner, released: list) -> None:
+        """
+        Detach a panner for reuse, or uninit it if the pool is full.
+
+        Detaching waits for the audio thread to finish with the node, so it
+        can then be reset from this thread.  Panners are only added to the
+        pool once their upstream nodes are gone (see cleanup).
+        """
+        pool = self._engine._panner_pool
+        if len(pool) + len(released) >= MAX_POOLED_PANNERS:
+            lib.panner_node_uninit(panner, _NULL)
+            return
+
+        lib.ma_node_detach_output_bus(panner, 0)
+        # Undo anything set_filter_gain changed
+        lib.ma_node_set_output_bus_volume(panner, 0, 1.0)
+        lib.ma_node_set_state(panner, lib.ma_node_state_started)
+        released.append(panner)
 
     @property
     def id(self) -> str:
@@ -171,22 +233,34 @@ class Sound:
         """
         Set overall volume (0.0 to 2.0+).
 
-        Uses ma_sound_set_fade for smooth 50ms transitions (thread-safe).
-        The -1 value for volumeBeg means "use current volume".
+        Volume lives on the sound's fader, using ma_sound_set_fade for
+        smooth 50ms transitions (thread-safe); the -1 value for volumeBeg
+        means "use current volume".  Once set_fade_at has scheduled a fade,
+        the fader is taken, so volume moves to the output bus and changes
+        instantly instead.
 
         Args:
             volume: Target volume level
-            use_fade: If True, fade over 50ms. If False, set instantly.
+            use_fade: If True, fade over 50ms. If False, set instantly; only
+                      before the sound starts.
         """
+        if volume == self._volume:
+            # Already at (or fading to) this volume; restarting the fade
+            # would only cost a call into miniaudio
+            return
         self._volume = volume
-        if use_fade:
+        if self._volume_on_bus:
+            # The fader is holding a scheduled fade (see set_fade_at)
+            lib.ma_node_set_output_bus_volume(self._sound, 0, volume)
+        elif use_fade:
             # Use fade for smooth transition (-1 = current volume)
-            lib.ma_sound_set_fade_in_pcm_frames(
+            _ma_sound_set_fade_in_pcm_frames(
                 self._sound, -1.0, volume, FADE_DURATION_FRAMES
             )
         else:
-            # Instant set via output bus volume (for initialization)
-            lib.ma_node_set_output_bus_volume(self._sound, 0, volume)
+            # Instant set before the sound starts, on the fader itself so
+            # later fades start from it
+            lib.sound_graph_set_initial_volume(self._sound, volume)
 
     def set_pan(self, pan: float) -> None:
         """
@@ -195,11 +269,15 @@ class Sound:
         Args:
             pan: -1.0 (full left) to +1.0 (full right), 0.0 = center
         """
-        self._pan = max(-1.0, min(1.0, pan))
-        lib.panner_node_set_pan(self._panner, self._pan)
+        # panner_node_set_pan clamps, so the unclamped value is kept here.
+        # Out-of-range values that clamp alike only cost a redundant store.
+        if pan == self._pan:
+            return
+        self._pan = pan
+        _panner_node_set_pan(self._panner, pan)
         # Also set pan on filtered panner if present
         if self._has_lpf and self._panner_filtered_initialized:
-            lib.panner_node_set_pan(self._panner_filtered, self._pan)
+            _panner_node_set_pan(self._panner_filtered, pan)
 
     def set_filter_gain(self, filter_gain: float) -> None:
         """
@@ -216,8 +294,25 @@ class Sound:
         self._filter_gain = max(0.0, min(1.0, filter_gain))
         # Set output bus volumes on the panners to control the blend
         # Unfiltered gets (1 - filter_gain), filtered gets filter_gain
-        lib.ma_node_set_output_bus_volume(self._panner, 0, 1.0 - self._filter_gain)
-        lib.ma_node_set_output_bus_volume(self._panner_filtered, 0, self._filter_gain)
+        lib.panner_node_set_blend(self._panner, self._panner_filtered, self._filter_gain)
+
+        # A branch at zero gain contributes nothing, so stop its panner.  A
+        # stopped node doesn't pull from its inputs, which means the LPF
+        # itself is skipped when fully unfiltered.
+        unfiltered_running = self._filter_gain < 1.0
+        if unfiltered_running != self._unfiltered_running:
+            lib.ma_node_set_state(self._panner, _node_state(unfiltered_running))
+            self._unfiltered_running = unfiltered_running
+
+        filtered_running = self._filter_gain > 0.0
+        if filtered_running != self._filtered_running:
+            lib.ma_node_set_state(self._panner_filtered, _node_state(filtered_running))
+            self._filtered_running = filtered_running
+
+    @property
+    def _ptr(self):
+        """Get the raw ma_sound pointer (for internal use)."""
+        return self._sound
 
     @property
     def has_lpf(self) -> bool:
@@ -226,8 +321,10 @@ class Sound:
 
     def set_pitch(self, pitch: float) -> None:
         """Set playback rate/pitch (0.5 to 2.0)."""
+        if pitch == self._pitch:
+            return
         self._pitch = pitch
-        lib.ma_sound_set_pitch(self._sound, pitch)
+        _ma_sound_set_pitch(self._sound, pitch)
 
     def set_looping(self, looping: bool) -> None:
         """Set whether the sound loops."""
@@ -238,21 +335,24 @@ class Sound:
         """Start playback."""
         if not self._started:
             result = lib.ma_sound_start(self._sound)
-            _check_result(result, f"Failed to start sound {self._id}")
+            # Checked inline so the error message is only formatted on failure
+            if result != 0:
+                raise MiniaudioError(result, f"Failed to start sound {self._id}")
             self._started = True
 
     def stop(self) -> None:
         """Stop playback immediately."""
         result = lib.ma_sound_stop(self._sound)
-        _check_result(result, f"Failed to stop sound {self._id}")
+        if result != 0:
+            raise MiniaudioError(result, f"Failed to stop sound {self._id}")
 
     def is_playing(self) -> bool:
         """Check if the sound is currently playing."""
-        return bool(lib.ma_sound_is_playing(self._sound))
+        return bool(_ma_sound_is_playing(self._sound))
 
     def is_at_end(self) -> bool:
         """Check if the sound has reached the end."""
-        return bool(lib.ma_sound_at_end(self._sound))
+        return bool(_ma_sound_at_end(self._sound))
 
     def is_finished(self) -> bool:
         """Check if the sound is finished (not looping and at end, or stopped)."""
@@ -263,13 +363,14 @@ class Sound:
     def seek(self, frame_index: int) -> None:
         """Seek to a specific frame position."""
         result = lib.ma_sound_seek_to_pcm_frame(self._sound, frame_index)
-        _check_result(result, f"Failed to seek sound {self._id}")
+        if result != 0:
+            raise MiniaudioError(result, f"Failed to seek sound {self._id}")
 
     def set_fade(
         self, volume_start: float, volume_end: float, duration_frames: int
     ) -> None:
         """Set a fade effect starting immediately."""
-        lib.ma_sound_set_fade_in_pcm_frames(
+        _ma_sound_set_fade_in_pcm_frames(
             self._sound, volume_start, volume_end, duration_frames
         )
 
@@ -280,10 +381,33 @@ class Sound:
         duration_frames: int,
         start_frame: int,
     ) -> None:
-        """Schedule a fade effect to start at a specific engine time."""
+        """
+        Schedule a fade effect to start at a specific engine time.
+
+        The fade multiplies the sound's volume, which moves to the output
+        bus so volume changes can't replace the pending fade.  Until the
+        fade starts, the fader passes audio through unchanged.
+        """
+        lib.ma_node_set_output_bus_volume(self._sound, 0, self._volume)
+        self._volume_on_bus = True
+        lib.ma_sound_set_fade_start_in_pcm_frames(
+            self._sound, volume_start, volume_end, duration_frames, start_frame
+        )
+
+    def ramp_volume_at(
+        self, volume_start: float, volume_end: float, duration_frames: int, start_frame: int
+    ) -> None:
+        """
+        Ramp volume linearly in miniaudio, starting at an engine time.
+
+        The ramp runs on the sound's fader, where set_volume keeps the
+        volume, so later fades from set_volume start from wherever the ramp
+        has got to.  Not for use with set_fade_at, which takes the fader.
+        """
         lib.ma_sound_set_fade_start_in_pcm_frames(
             self._sound, volume_start, volume_end, duration_frames, start_frame
         )
+        self._volume = volume_end
 
     def schedule_start(self, absolute_frame: int) -> None:
         """Schedule the sound to start at a specific engine time."""
@@ -296,31 +420,45 @@ class Sound:
     def cleanup(self) -> None:
         """Release sound resources."""
         # Uninit downstream nodes first (reverse order of the graph)
+        released_panners = []
 
-        # Uninit filtered panner (if present)
+        # Release filtered panner (if present)
         if self._panner_filtered_initialized:
-            lib.panner_node_uninit(self._panner_filtered, ffi.NULL)
+            self._release_panner(self._panner_filtered, released_panners)
             self._panner_filtered_initialized = False
 
-        # Uninit unfiltered panner
+        # Release unfiltered panner
         if self._panner_initialized:
-            lib.panner_node_uninit(self._panner, ffi.NULL)
+            self._release_panner(self._panner, released_panners)
             self._panner_initialized = False
 
         # Uninit LPF node (if present)
         if self._lpf_initialized:
-            lib.ma_lpf_node_uninit(self._lpf_node, ffi.NULL)
+            lib.ma_lpf_node_uninit(self._lpf_node, _NULL)
             self._lpf_initialized = False
+            if len(_lpf_buffers) < MAX_POOLED_NODE_BUFFERS:
+                _lpf_buffers.append(self._lpf_node)
+            self._lpf_node = None
 
         # Uninit splitter (if present)
         if self._splitter_initialized:
-            lib.ma_splitter_node_uninit(self._splitter, ffi.NULL)
+            lib.ma_splitter_node_uninit(self._splitter, _NULL)
             self._splitter_initialized = False
+            if len(_splitter_buffers) < MAX_POOLED_NODE_BUFFERS:
+                _splitter_buffers.append(self._splitter)
+            self._splitter = None
 
         # Uninit sound
         if self._initialized:
             lib.ma_sound_uninit(self._sound)
             self._initialized = False
+            if len(_sound_buffers) < MAX_POOLED_SOUND_BUFFERS:
+                _sound_buffers.append(self._sound)
+            # The buffer may now belong to another Sound
+            self._sound = None
+
+        # Nothing feeds the released panners any more, so they can be reused
+        self._engine._panner_pool.extend(released_panners)
 
         # Also cleanup the source
         if self._source:
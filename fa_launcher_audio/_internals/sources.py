@@ -1,16 +1,36 @@
 """Audio data sources for miniaudio."""
 
 from fa_launcher_audio._audio_cffi import ffi, lib
-from fa_launcher_audio._internals.engine import _check_result
+from fa_launcher_audio._internals.engine import MiniaudioError, _check_result
+
+# Pre-parsed pointer types, so per-source allocations skip CFFI's type parsing
+_SINE_OSC_P = ffi.typeof("sine_osc*")
+_MA_WAVEFORM_P = ffi.typeof("ma_waveform*")
+_MA_DECODER_P = ffi.typeof("ma_decoder*")
+_MA_UINT64_P = ffi.typeof("ma_uint64*")
+_MA_WAVEFORM_CONFIG_P = ffi.typeof("ma_waveform_config*")
+_MA_AUDIO_BUFFER_REF_P = ffi.typeof("ma_audio_buffer_ref*")
+_FLOAT_ARRAY = ffi.typeof("float[]")
+
+# Frames decoded per read when a decoder can't report its length up front
+_DECODE_CHUNK_FRAMES = 65536
+
+_sound_poll_source_reached = lib.sound_poll_source_reached
 
 
 class WaveformSource:
     """
     Generates waveform audio (sine, square, triangle, sawtooth).
 
-    This wraps miniaudio's ma_waveform generator.
+    Sine uses our trig-free sine_osc data source; the other types wrap
+    miniaudio's ma_waveform generator, which is already cheap for them.
     """
 
+    __slots__ = (
+        "_initialized", "_is_sine", "_waveform_type", "_frequency", "_amplitude",
+        "_duration_frames", "_end_frame", "_waveform",
+    )
+
     TYPES = {
         "sine": lib.ma_waveform_type_sine,
         "square": lib.ma_waveform_type_square,
@@ -54,33 +74,35 @@ class WaveformSource:
         """
         self._initialized = False  # Set early to prevent __del__ errors
 
-        if waveform_type not in self.TYPES:
+        prototype = _WAVEFORM_CONFIGS.get(waveform_type)
+        if prototype is None:
             raise ValueError(
                 f"Unknown waveform type: {waveform_type}. "
                 f"Valid types: {list(self.TYPES.keys())}"
             )
 
-        self._waveform = ffi.new("ma_waveform*")
+        self._is_sine = prototype is _SINE
         self._waveform_type = waveform_type
         self._frequency = frequency
         self._amplitude = amplitude
         self._duration_frames = (
             int(duration_seconds * self.SAMPLE_RATE) if duration_seconds else None
         )
-        self._frames_read = 0
-
-        # Configure waveform
-        config = lib.ma_waveform_config_init(
-            lib.ma_format_f32,
-            self.CHANNELS,
-            self.SAMPLE_RATE,
-            self.TYPES[waveform_type],
-            amplitude,
-            frequency,
-        )
-
-        result = lib.ma_waveform_init(ffi.addressof(config), self._waveform)
-        _check_result(result, f"Failed to initialize waveform ({waveform_type})")
+        # Cursor position at which the duration runs out
+        self._end_frame = self._duration_frames
+
+        if self._is_sine:
+            self._waveform = ffi.new(_SINE_OSC_P)
+            result = lib.sine_osc_init(self.SAMPLE_RATE, frequency, amplitude, self._waveform)
+        else:
+            self._waveform = ffi.new(_MA_WAVEFORM_P)
+            # Copy the type's prepared config; only these two fields vary
+            config = ffi.new(_MA_WAVEFORM_CONFIG_P, prototype)
+            config.amplitude = amplitude
+            config.frequency = frequency
+            result = lib.ma_waveform_init(config, self._waveform)
+        if result:
+            raise MiniaudioError(result, f"Failed to initialize waveform ({waveform_type})")
         self._initialized = True
 
         # Seek to zero-crossing phase to avoid click on start
@@ -89,28 +111,42 @@ class WaveformSource:
             # frame = phase * sample_rate / frequency
             frame_index = int(zero_phase * self.SAMPLE_RATE / frequency)
             lib.ma_waveform_seek_to_pcm_frame(self._waveform, frame_index)
+            # The cursor now starts here, not at zero
+            if self._duration_frames is not None:
+                self._end_frame = frame_index + self._duration_frames
 
     def set_frequency(self, frequency: float) -> None:
         """Change the waveform frequency."""
         self._frequency = frequency
-        lib.ma_waveform_set_frequency(self._waveform, frequency)
+        if self._is_sine:
+            lib.sine_osc_set_frequency(self._waveform, frequency)
+        else:
+            lib.ma_waveform_set_frequency(self._waveform, frequency)
 
     def set_amplitude(self, amplitude: float) -> None:
         """Change the waveform amplitude."""
         self._amplitude = amplitude
-        lib.ma_waveform_set_amplitude(self._waveform, amplitude)
+        if self._is_sine:
+            lib.sine_osc_set_amplitude(self._waveform, amplitude)
+        else:
+            lib.ma_waveform_set_amplitude(self._waveform, amplitude)
 
     def reset(self) -> None:
         """Reset waveform to beginning."""
-        lib.ma_waveform_seek_to_pcm_frame(self._waveform, 0)
-        self._frames_read = 0
+        if self._is_sine:
+            lib.sine_osc_seek_to_pcm_frame(self._waveform, 0)
+        else:
+            lib.ma_waveform_seek_to_pcm_frame(self._waveform, 0)
+        self._end_frame = self._duration_frames
 
     @property
     def is_finished(self) -> bool:
         """Check if the waveform has finished (only if duration was set)."""
-        if self._duration_frames is None:
+        end_frame = self._end_frame
+        if end_frame is None:
             return False
-        return self._frames_read >= self._duration_frames
+        # Compared against the generator's own read cursor in C
+        return bool(_sound_poll_source_reached(self._waveform, end_frame))
 
     def get_data_source_ptr(self):
         """Get pointer to underlying data source for ma_sound_init_from_data_source."""
@@ -119,13 +155,34 @@ class WaveformSource:
     def cleanup(self) -> None:
         """Release resources."""
         if self._initialized:
-            lib.ma_waveform_uninit(self._waveform)
+            if self._is_sine:
+                lib.sine_osc_uninit(self._waveform)
+            else:
+                lib.ma_waveform_uninit(self._waveform)
             self._initialized = False
 
     def __del__(self):
         self.cleanup()
 
 
+# Stands in for a config in _WAVEFORM_CONFIGS: sine goes to sine_osc instead
+_SINE = object()
+
+# ma_waveform configs per type name, built once.  Looking the name up here
+# also validates it, and saves a ma_waveform_config_init call per source.
+_WAVEFORM_CONFIGS = {
+    name: _SINE if name == "sine" else lib.ma_waveform_config_init(
+        lib.ma_format_f32,
+        WaveformSource.CHANNELS,
+        WaveformSource.SAMPLE_RATE,
+        waveform_type,
+        1.0,
+        440.0,
+    )
+    for name, waveform_type in WaveformSource.TYPES.items()
+}
+
+
 class DecoderSource:
     """
     Decodes audio from bytes (wav, flac, mp3, ogg).
@@ -133,41 +190,72 @@ class DecoderSource:
     This wraps miniaudio's ma_decoder. Decodes to mono.
     """
 
+    __slots__ = ("_data", "_decoder", "_initialized", "_sample_rate", "_length_frames")
+
     SAMPLE_RATE = 44100
     CHANNELS = 1  # Downmix to mono
 
-    def __init__(self, audio_bytes: bytes):
+    def __init__(self, audio_bytes: bytes, sample_rate: int = SAMPLE_RATE):
         """
         Create a decoder from audio bytes.
 
         Args:
             audio_bytes: Raw audio file bytes (wav, flac, mp3, or ogg)
+            sample_rate: Rate to resample the decoded audio to
         """
-        self._bytes = audio_bytes  # Keep reference to prevent GC
-        self._decoder = ffi.new("ma_decoder*")
+        # The decoder reads straight from this memory for as long as it lives.
+        # The cdata keeps the buffer it wraps alive, so it is all we hold on to.
+        self._data = ffi.from_buffer(audio_bytes)
+        self._decoder = ffi.new(_MA_DECODER_P)
         self._initialized = False
 
-        # Configure decoder for float32 stereo output at our sample rate
+        # Configure decoder for float32 mono output at the requested rate
+        self._sample_rate = sample_rate
         config = lib.ma_decoder_config_init(
-            lib.ma_format_f32, self.CHANNELS, self.SAMPLE_RATE
+            lib.ma_format_f32, self.CHANNELS, sample_rate
         )
 
         result = lib.ma_decoder_init_memory(
-            ffi.from_buffer(self._bytes),
-            len(self._bytes),
+            self._data,
+            len(self._data),
             ffi.addressof(config),
             self._decoder,
         )
         _check_result(result, "Failed to initialize decoder")
         self._initialized = True
 
+        # The length never changes, so ask for it once.  0 if unknown.
+        length = ffi.new(_MA_UINT64_P)
+        result = lib.ma_decoder_get_length_in_pcm_frames(self._decoder, length)
+        self._length_frames = int(length[0]) if result == 0 else 0
+
     def get_length_frames(self) -> int:
         """Get total length in PCM frames."""
-        length = ffi.new("ma_uint64*")
-        result = lib.ma_decoder_get_length_in_pcm_frames(self._decoder, length)
-        if result != 0:
-            return 0
-        return int(length[0])
+        return self._length_frames
+
+    def decode_all(self) -> "DecodedPcm":
+        """Decode everything from the current position into one buffer."""
+        frames_read = ffi.new(_MA_UINT64_P)
+        length = self.get_length_frames()
+        if length:
+            data = ffi.new(_FLOAT_ARRAY, length)
+            lib.ma_decoder_read_pcm_frames(self._decoder, data, length, frames_read)
+            return DecodedPcm(data, int(frames_read[0]), self._sample_rate)
+
+        # Length unknown up front: read in chunks, then copy into one buffer
+        chunk = ffi.new(_FLOAT_ARRAY, _DECODE_CHUNK_FRAMES)
+        chunk_bytes = ffi.buffer(chunk)
+        samples = bytearray()
+        while True:
+            lib.ma_decoder_read_pcm_frames(self._decoder, chunk, _DECODE_CHUNK_FRAMES, frames_read)
+            count = int(frames_read[0])
+            samples += chunk_bytes[:count * 4]
+            if count < _DECODE_CHUNK_FRAMES:
+                break
+        frames = len(samples) // 4
+        data = ffi.new(_FLOAT_ARRAY, frames)
+        ffi.memmove(data, samples, len(samples))
+        return DecodedPcm(data, frames, self._sample_rate)
 
     def reset(self) -> None:
         """Reset decoder to beginning."""
@@ -187,3 +275,81 @@ class DecoderSource:
         self.cleanup()
 
 
+class DecodedPcm:
+    """Fully decoded mono float32 audio, shared by every PcmSource playing it."""
+
+    __slots__ = ("data", "frames", "sample_rate")
+
+    def __init__(self, data, frames: int, sample_rate: int):
+        self.data = data
+        self.frames = frames
+        self.sample_rate = sample_rate
+
+    @property
+    def nbytes(self) -> int:
+        """Size of the samples in bytes."""
+        return self.frames * 4
+
+    @classmethod
+    def decode(cls, audio_bytes: bytes, sample_rate: int) -> "DecodedPcm":
+        """Decode audio bytes (wav, flac, mp3, or ogg) to mono at sample_rate."""
+        decoder = DecoderSource(audio_bytes, sample_rate)
+        try:
+            return decoder.decode_all()
+        finally:
+            decoder.cleanup()
+
+
+class PcmSource:
+    """
+    Plays already-decoded audio (see DecodedPcm).
+
+    This wraps miniaudio's ma_audio_buffer_ref, which reads the shared samples
+    in place: many sounds can play the same PCM with their own cursors, and
+    none of them decodes anything during playback.
+    """
+
+    __slots__ = ("_pcm", "_buffer", "_initialized")
+
+    CHANNELS = 1
+
+    def __init__(self, pcm: DecodedPcm):
+        """
+        Create a source over decoded audio.
+
+        Args:
+            pcm: The samples to play.  Kept alive for as long as this source.
+        """
+        self._pcm = pcm
+        self._buffer = ffi.new(_MA_AUDIO_BUFFER_REF_P)
+        self._initialized = False
+
+        result = lib.ma_audio_buffer_ref_init(
+            lib.ma_format_f32, self.CHANNELS, pcm.data, pcm.frames, self._buffer
+        )
+        _check_result(result, "Failed to initialize audio buffer")
+        # ma_audio_buffer_ref_init leaves the rate at 0, which miniaudio
+        # would take to mean the engine's rate
+        self._buffer.sampleRate = pcm.sample_rate
+        self._initialized = True
+
+    def get_length_frames(self) -> int:
+        """Get total length in PCM frames."""
+        return self._pcm.frames
+
+    def reset(self) -> None:
+        """Reset to the beginning."""
+        lib.ma_audio_buffer_ref_seek_to_pcm_frame(self._buffer, 0)
+
+    def get_data_source_ptr(self):
+        """Get pointer to underlying data source for ma_sound_init_from_data_source."""
+        return self._buffer
+
+    def cleanup(self) -> None:
+        """Release resources."""
+        if self._initialized:
+            lib.ma_audio_buffer_ref_uninit(self._buffer)
+            self._initialized = False
+
+    def __del__(self):
+        self.cleanup()
@@ -0,0 +1,84 @@
+"""Reusable command templates with substitution slots."""
+
+from typing import Any, Callable
+
+# A path from the template root to a value: dict keys and list indices
+_Path = tuple[str | int, ...]
+
+
+def compile_template(template: dict) -> Callable[..., dict]:
+    """
+    Compile a command template into a function that fills it in.
+
+    Any string value of the form "$name" is a slot.  A string value that
+    should start with "$" is escaped by doubling it: "$$coin.ogg" is the
+    literal "$coin.ogg".  The returned function takes the slot values as
+    keyword arguments and returns a command dict.
+
+    The template is copied once here, so changing it afterwards doesn't
+    affect the compiled function.  Each call only rebuilds the dicts and
+    lists that lead to a slot and shares everything else between commands.
+
+    Example:
+        make_ping = compile_template({
+            "command": "patch",
+            "id": "$id",
+            "source": {"kind": "waveform", "waveform": "sine", "frequency": "$freq"},
+        })
+        make_ping(id="ping", freq=440)
+    """
+    slots: dict[_Path, str] = {}
+    template = _compile(template, (), slots)
+
+    names = frozenset(slots.values())
+    # Every prefix of a slot path must be copied; anything else is shared
+    dirty = {path[:i] for path in slots for i in range(len(path))}
+
+    def fill(**values: Any) -> dict:
+        if values.keys() != names:
+            missing = names - values.keys()
+            if missing:
+                raise TypeError(f"Template missing values: {sorted(missing)}")
+            raise TypeError(f"Unknown template values: {sorted(values.keys() - names)}")
+        return _rebuild(template, (), slots, dirty, values)
+
+    return fill
+
+
+def _compile(node: Any, path: _Path, slots: dict[_Path, str]) -> Any:
+    """Deep-copy node, recording the path of every "$name" slot and unescaping "$$"."""
+    if isinstance(node, str):
+        if node.startswith("$$"):
+            return node[1:]
+        if node.startswith("$") and len(node) > 1:
+            slots[path] = node[1:]
+        return node
+    if isinstance(node, dict):
+        return {key: _compile(value, path + (key,), slots) for key, value in node.items()}
+    if isinstance(node, list):
+        return [_compile(value, path + (i,), slots) for i, value in enumerate(node)]
+    return node
+
+
+def _rebuild(
+    node: Any,
+    path: _Path,
+    slots: dict[_Path, str],
+    dirty: set[_Path],
+    values: dict[str, Any],
+) -> Any:
+    """Copy the containers leading to slots, substituting slot values."""
+    name = slots.get(path)
+    if name is not None:
+        return values[name]
+    if path not in dirty:
+        return node
+    if isinstance(node, dict):
+        return {
+            key: _rebuild(value, path + (key,), slots, dirty, values)
+            for key, value in node.items()
+        }
+    return [
+        _rebuild(value, path + (i,), slots, dirty, values)
+        for i, value in enumerate(node)
+    ]
@@ -1,30 +1,57 @@
 """Background worker thread for command processing."""
 
-import queue
+import heapq
 import threading
-import time
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
 
-from fa_launcher_audio._internals.cache import BytesCache
+from fa_launcher_audio._audio_cffi import ffi, lib
+from fa_launcher_audio._internals.cache import BytesCache, PcmCache, DEFAULT_MAX_PCM_BYTES
 from fa_launcher_audio._internals.engine import MiniaudioEngine
 from fa_launcher_audio._internals.sound import Sound
-from fa_launcher_audio._internals.sources import WaveformSource, DecoderSource
+from fa_launcher_audio._internals.sources import WaveformSource, DecoderSource, DecodedPcm, PcmSource
 from fa_launcher_audio._internals.commands import (
-    parse_command,
+    prepare_command,
+    Command,
     PatchCommand,
     StopCommand,
     CompoundCommand,
-    LpfConfig,
-    validate_command,
 )
-from fa_launcher_audio._internals.parameters import VolumeParams, Parameter, StaticParam
+from fa_launcher_audio._internals.parameters import VolumeParams, Parameter, TimeEnvelope
 
 
 SAMPLE_RATE = 44100
 
+# What prepare_command returns; the worker runs these without checking again
+_PREPARED_TYPES = (PatchCommand, StopCommand, CompoundCommand)
+
 
 class ManagedSound:
     """A sound with its associated parameters for updating."""
 
+    __slots__ = (
+        "sound",
+        "start_time",
+        "duration",
+        "scheduled",
+        "scheduled_stop_frame",
+        "stopped_by_duration",
+        "volume_params",
+        "playback_rate",
+        "filter_gain",
+        "_native_volume",
+        "_set_volume",
+        "_set_pan",
+        "_set_pitch",
+        "_get_volume_values",
+        "_get_pan",
+        "_get_rate",
+        "_get_filter_gain",
+        "_set_filter_gain",
+        "_constant",
+        "_applied",
+    )
+
     def __init__(
         self,
         sound: Sound,
@@ -35,18 +62,62 @@ class ManagedSound:
         scheduled: bool = False,
         scheduled_stop_frame: int | None = None,
         filter_gain: Parameter | None = None,
+        native_volume: bool = False,
     ):
         self.sound = sound
-        self.volume_params = volume_params
-        self.playback_rate = playback_rate
         self.start_time = start_time  # Engine time when sound becomes active
         self.duration = duration  # None means play until natural end
         self.scheduled = scheduled  # True if waiting for scheduled start
         self.scheduled_stop_frame = scheduled_stop_frame  # Frame when sound will stop (miniaudio clock)
         self.stopped_by_duration = False
+        # Bound once: update() runs every tick while the sound is changing. The
+        # initial volume is set instantly by CommandWorker._create_new_sound,
+        # so every update here fades.
+        self._set_volume = sound.set_volume
+        self._set_pan = sound.set_pan
+        self._set_pitch = sound.set_pitch
+        self.set_parameters(volume_params, playback_rate, filter_gain, native_volume)
+
+    def set_parameters(
+        self,
+        volume_params: VolumeParams,
+        playback_rate: Parameter,
+        filter_gain: Parameter | None,
+        native_volume: bool = False,
+    ) -> None:
+        """
+        Replace the parameters applied on future updates.
+
+        native_volume means miniaudio is already ramping the volume (see
+        CommandWorker._create_new_sound), so updates leave it alone.
+        """
+        self.volume_params = volume_params
+        self.playback_rate = playback_rate
         self.filter_gain = filter_gain  # Only used when sound has LPF
-        # Track if this is the first update (for initial instant set vs fade)
-        self._first_update = True
+        self._native_volume = native_volume
+        self._get_volume_values = volume_params.get_values
+        self._get_pan = volume_params.pan.get_value
+        self._get_rate = playback_rate.get_value
+        # Filter gain only applies to sounds built with an LPF
+        if filter_gain is not None and self.sound.has_lpf:
+            self._get_filter_gain = filter_gain.get_value
+            self._set_filter_gain = self.sound.set_filter_gain
+        else:
+            self._get_filter_gain = None
+        # Constant parameters only need applying once; after that, updates
+        # skip evaluating them entirely
+        self._constant = (
+            (native_volume or volume_params.volume.is_constant())
+            and volume_params.pan.is_constant()
+            and playback_rate.is_constant()
+            and (filter_gain is None or filter_gain.is_constant())
+        )
+        self._applied = False
+
+    @property
+    def native_volume(self) -> bool:
+        """True while miniaudio's fader runs the volume ramp instead of updates."""
+        return self._native_volume
 
     def update(self, current_time: float) -> None:
         """Update sound parameters based on current time."""
@@ -66,30 +137,32 @@ class ManagedSound:
                 self.stopped_by_duration = True
                 return
 
-        # Update volume and pan
-        # Volume now uses 50ms fades for smooth transitions (except first update)
-        volume, pan = self.volume_params.get_values(elapsed)
-        self.sound.set_volume(volume, use_fade=not self._first_update)
-        self.sound.set_pan(pan)
-
-        # Update pitch
-        pitch = self.playback_rate.get_value(elapsed)
-        self.sound.set_pitch(pitch)
-
-        # Update filter gain if this sound has LPF
-        if self.filter_gain is not None and self.sound.has_lpf:
-            fg = self.filter_gain.get_value(elapsed)
-            self.sound.set_filter_gain(fg)
-
-        self._first_update = False
+        if self._applied and self._constant:
+            return
 
-    def is_finished(self, current_frame: int) -> bool:
-        """Check if the sound is finished (either naturally or by duration or scheduled stop)."""
-        if self.stopped_by_duration:
-            return True
-        if self.scheduled_stop_frame is not None and current_frame >= self.scheduled_stop_frame:
-            return True
-        return self.sound.is_finished()
+        # Volume uses 50ms fades for smooth transitions
+        if self._native_volume:
+            pan = self._get_pan(elapsed)
+        else:
+            volume, pan = self._get_volume_values(elapsed)
+            self._set_volume(volume, True)
+        self._set_pan(pan)
+        self._set_pitch(self._get_rate(elapsed))
+
+        get_filter_gain = self._get_filter_gain
+        if get_filter_gain is not None:
+            self._set_filter_gain(get_filter_gain(elapsed))
+
+        self._applied = True
+
+    def is_idle(self) -> bool:
+        """Check if updates have nothing left to do until the parameters change."""
+        return (
+            self._applied
+            and self._constant
+            and not self.scheduled
+            and self.duration is None  # Stays ticking until cleaned up
+        )
 
 
 class CommandWorker:
@@ -103,18 +176,56 @@ class CommandWorker:
     """
 
     UPDATE_INTERVAL = 0.01  # 10ms tick
+    # Most commands handled before sounds are updated again, so a burst of
+    # commands can't hold up envelopes and cleanup for long
+    MAX_COMMANDS_PER_TICK = 256
 
     def __init__(
         self,
         engine: MiniaudioEngine,
         bytes_cache: BytesCache,
+        pcm_cache_max_bytes: int = DEFAULT_MAX_PCM_BYTES,
     ):
         self._engine = engine
+        # Converts engine frames to the seconds get_time_seconds would give
+        self._inv_sample_rate = 1.0 / engine.sample_rate
         self._bytes_cache = bytes_cache
+        self._pcm_cache = PcmCache(max_bytes=pcm_cache_max_bytes)
+        # Names not yet in the PCM cache stream through a DecoderSource while
+        # the preload thread decodes them, so the worker never decodes a whole
+        # file itself.  With no PCM budget there is nothing to decode for.
+        self._cache_pcm = pcm_cache_max_bytes > 0
+        # Audio decoded on the preload thread, waiting for the worker to cache
+        # it (None if decoding failed).  The preload thread appends and the
+        # worker pops, as with _pending.
+        self._preloaded: deque[tuple[str, DecodedPcm | None]] = deque()
+        self._preloader = ThreadPoolExecutor(max_workers=1, thread_name_prefix="audio-preload")
+        # Decodes the worker started on a cache miss, by name
+        self._decoding: dict[str, Future[None]] = {}
+        # Names whose decoded audio is bigger than the whole PCM budget
+        self._uncacheable: set[str] = set()
         self._sounds: dict[str, ManagedSound] = {}
-        self._queue: queue.Queue[str | dict] = queue.Queue()
+        # The subset of self._sounds that still needs ticking.  Idle sounds
+        # (see ManagedSound.is_idle) are only polled for finishing until a
+        # patch gives them new parameters.
+        self._ticking: dict[str, ManagedSound] = {}
+        # Min-heap of (scheduled_stop_frame, id), so cleanup only looks at
+        # scheduled stops that are due.  Entries for sounds already removed
+        # are skipped when popped.
+        self._stop_heap: list[tuple[int, str]] = []
+        # Snapshot of self._sounds for sound_poll_finished: ids, their
+        # ma_sound pointers and room for the result.  None when stale.
+        self._poll_ids: list[str] | None = None
+        self._poll_sounds = None
+        self._poll_out = None
+        # Pending commands.  deque.append/popleft are atomic, so submitters
+        # never contend on a lock with the worker; the event only wakes it.
+        self._pending: deque[str | bytes | dict | Command] = deque()
+        self._wake = threading.Event()
         self._running = False
         self._thread: threading.Thread | None = None
+        # Indexed by Command.KIND
+        self._handlers = (self._handle_stop, self._handle_patch, self._handle_compound)
 
     def start(self) -> None:
         """Start the background worker thread."""
@@ -128,71 +239,123 @@ class CommandWorker:
     def stop(self) -> None:
         """Stop the worker thread and cleanup all sounds."""
         self._running = False
+        self._wake.set()
 
         if self._thread:
             self._thread.join(timeout=1.0)
             self._thread = None
 
+        self._preloader.shutdown(wait=False, cancel_futures=True)
+
         # Cleanup all sounds
         for managed in self._sounds.values():
             managed.sound.cleanup()
         self._sounds.clear()
+        self._ticking.clear()
+        self._stop_heap.clear()
+        self._poll_ids = None
 
-    def submit(self, command: str | dict) -> None:
+    def submit(self, command: str | bytes | dict | Command) -> None:
         """Queue a command for processing."""
-        self._queue.put(command)
+        self._pending.append(command)
+        self._wake.set()
+
+    def preload(self, name: str) -> "Future[None]":
+        """
+        Load and decode a sound on a background thread, ahead of playing it.
+
+        The decoded audio goes into the PCM cache on the worker's next tick.
+        A sound started before then streams from the encoded bytes.
+        """
+        return self._preloader.submit(self._preload, name)
+
+    def _preload(self, name: str, audio_bytes: bytes | None = None) -> None:
+        """Decode one sound on the preload thread and hand it to the worker."""
+        pcm = None
+        try:
+            if audio_bytes is None:
+                audio_bytes = self._bytes_cache.get(name)
+            # At the engine's rate, so playback at pitch 1 never resamples.
+            # CFFI releases the GIL while miniaudio decodes, so the worker
+            # keeps running.
+            pcm = DecodedPcm.decode(audio_bytes, self._engine.sample_rate)
+        finally:
+            # Even on failure, so the worker stops waiting on this name
+            self._preloaded.append((name, pcm))
+            self._wake.set()
 
     def _run(self) -> None:
         """Worker thread main loop."""
         while self._running:
-            # Wait for command or timeout
-            try:
-                cmd_data = self._queue.get(timeout=self.UPDATE_INTERVAL)
-                self._process_single_command(cmd_data)
-                # Drain any additional queued commands
-                self._process_commands()
-            except queue.Empty:
-                pass  # Timeout - just continue to updates
-
-            # Update active sounds
-            self._update_sounds()
+            # Wait for a command or timeout.  Clear before draining so a
+            # command submitted mid-drain leaves the event set for next time.
+            # With no sounds there is nothing to tick, so only a command (or
+            # preload, or stop) wakes the worker.
+            self._wake.wait(timeout=self.UPDATE_INTERVAL if self._sounds else None)
+            self._wake.clear()
+            self._process_commands()
+
+            # One engine time sample serves the whole tick
+            current_frame = self._engine.get_time_frames()
+
+            # Update sounds whose parameters are still changing
+            if self._ticking:
+                self._update_sounds(current_frame)
 
             # Remove finished sounds
-            self._cleanup_finished()
+            self._cleanup_finished(current_frame)
 
-    def _process_single_command(self, cmd_data: str | dict) -> None:
+    def _process_single_command(self, cmd_data: str | bytes | dict | Command) -> None:
         """Process a single command."""
-        cmd = parse_command(cmd_data)
-        errors = validate_command(cmd)
-        if errors:
-            raise ValueError(f"Command validation errors: {errors}")
-
-        self._execute_command(cmd)
+        if not isinstance(cmd_data, _PREPARED_TYPES):
+            # Already parsed objects came from prepare_command
+            cmd_data = prepare_command(cmd_data)
+        self._execute_command(cmd_data)
 
     def _process_commands(self) -> None:
-        """Process all pending commands."""
-        while True:
-            try:
-                cmd_data = self._queue.get_nowait()
-            except queue.Empty:
-                break
+        """Process pending commands, up to MAX_COMMANDS_PER_TICK."""
+        preloaded = self._preloaded
+        while preloaded:
+            name, pcm = preloaded.popleft()
+            self._decoding.pop(name, None)
+            if pcm is None:
+                continue
+            if self._pcm_cache.put(name, pcm):
+                # New sounds play the PCM now; playing ones hold their own copy
+                self._bytes_cache.discard(name)
+            else:
+                self._uncacheable.add(name)
+
+        pending = self._pending
+        process = self._process_single_command
+        for _ in range(min(len(pending), self.MAX_COMMANDS_PER_TICK)):
+            process(pending.popleft())
 
-            self._process_single_command(cmd_data)
+        if pending:
+            # More queued than one tick handles; run again without waiting
+            self._wake.set()
 
     def _execute_command(self, cmd: PatchCommand | StopCommand | CompoundCommand) -> None:
         """Execute a parsed command."""
-        if isinstance(cmd, StopCommand):
-            self._handle_stop(cmd)
-        elif isinstance(cmd, PatchCommand):
-            self._handle_patch(cmd)
-        elif isinstance(cmd, CompoundCommand):
-            for sub_cmd in cmd.commands:
-                self._execute_command(sub_cmd)
+        self._handlers[cmd.KIND](cmd)
+
+    def _handle_compound(self, cmd: CompoundCommand) -> None:
+        """Handle a compound command, flattening nested ones in order without recursing."""
+        handlers = self._handlers
+        stack = list(reversed(cmd.commands))
+        while stack:
+            sub_cmd = stack.pop()
+            if sub_cmd.KIND == CompoundCommand.KIND:
+                stack.extend(reversed(sub_cmd.commands))
+            else:
+                handlers[sub_cmd.KIND](sub_cmd)
 
     def _handle_stop(self, cmd: StopCommand) -> None:
         """Handle a stop command."""
         if cmd.id in self._sounds:
             managed = self._sounds.pop(cmd.id)
+            self._ticking.pop(cmd.id, None)
+            self._poll_ids = None
             managed.sound.stop()
             managed.sound.cleanup()
 
@@ -229,52 +392,51 @@ class CommandWorker:
         if cmd.filter_gain is not None and sound.has_lpf:
             sound.set_filter_gain(cmd.filter_gain.get_value(0.0))
 
-        current_time = self._engine.get_time_seconds()
         current_frame = self._engine.get_time_frames()
+        current_time = current_frame * self._inv_sample_rate
 
         # Get duration from waveform source if available (and not looping)
         duration = None
         if not cmd.looping and cmd.source.kind == "waveform" and cmd.source.non_looping_duration:
             duration = cmd.source.non_looping_duration
 
+        # Engine frame the sound starts playing at
+        start_frame = current_frame + int(cmd.start_time * SAMPLE_RATE)
+        has_fade_out = bool(cmd.source.kind == "waveform" and cmd.source.fade_out and duration)
+
+        # A volume envelope that is one linear ramp from the start can run in
+        # miniaudio's fader, so the worker never has to tick it.  The fader
+        # holds one pending fade, so not when a fade-out is scheduled on it.
+        # Set up before starting so no block plays at the wrong volume.
+        native_volume = False
+        volume = cmd.volume_params.volume
+        if isinstance(volume, TimeEnvelope) and not has_fade_out:
+            ramp = volume.linear_ramp()
+            if ramp is not None and ramp[0] >= 0.0:
+                volume_start, volume_end, ramp_seconds = ramp
+                sound.ramp_volume_at(
+                    volume_start, volume_end, int(ramp_seconds * SAMPLE_RATE), start_frame
+                )
+                native_volume = True
+
         # Handle scheduled start
-        scheduled = False
-        scheduled_stop_frame = None
-        if cmd.start_time > 0:
-            start_frame = current_frame + int(cmd.start_time * SAMPLE_RATE)
+        scheduled = cmd.start_time > 0
+        if scheduled:
             sound.schedule_start(start_frame)
 
-            # Schedule fade-out if waveform has fade_out and duration
-            # Use -1 for start volume (current volume) since volume is controlled
-            # via node bus, not the internal fader
-            if cmd.source.kind == "waveform" and cmd.source.fade_out and duration:
-                fade_out_frames = int(cmd.source.fade_out * SAMPLE_RATE)
-                scheduled_stop_frame = start_frame + int(duration * SAMPLE_RATE)
-                fade_out_start_frame = scheduled_stop_frame - fade_out_frames
-                sound.set_fade_at(-1.0, 0.0, fade_out_frames, fade_out_start_frame)
-
-                # Schedule stop at end
-                sound.schedule_stop(scheduled_stop_frame)
-
-            sound.start()
-            scheduled = True
-            start_time = current_time + cmd.start_time
-        else:
-            # Immediate start
-            # Schedule fade-out if waveform has fade_out and duration
-            # Use -1 for start volume (current volume) since volume is controlled
-            # via node bus, not the internal fader
-            if cmd.source.kind == "waveform" and cmd.source.fade_out and duration:
-                fade_out_frames = int(cmd.source.fade_out * SAMPLE_RATE)
-                scheduled_stop_frame = current_frame + int(duration * SAMPLE_RATE)
-                fade_out_start_frame = scheduled_stop_frame - fade_out_frames
-                sound.set_fade_at(-1.0, 0.0, fade_out_frames, fade_out_start_frame)
-
-                # Schedule stop at end
-                sound.schedule_stop(scheduled_stop_frame)
-
-            sound.start()
-            start_time = current_time
+        # Schedule fade-out and stop if waveform has fade_out and duration.
+        # The fade runs on the fader from 1 to 0, scaling the volume, which
+        # set_fade_at moves to the output bus.
+        scheduled_stop_frame = None
+        if has_fade_out:
+            fade_out_frames = int(cmd.source.fade_out * SAMPLE_RATE)
+            scheduled_stop_frame = start_frame + int(duration * SAMPLE_RATE)
+            fade_out_start_frame = scheduled_stop_frame - fade_out_frames
+            sound.set_fade_at(1.0, 0.0, fade_out_frames, fade_out_start_frame)
+            sound.schedule_stop(scheduled_stop_frame)
+
+        sound.start()
+        start_time = current_time + cmd.start_time
 
         # Track for updates
         managed = ManagedSound(
@@ -286,8 +448,13 @@ class CommandWorker:
             scheduled=scheduled,
             scheduled_stop_frame=scheduled_stop_frame,
             filter_gain=cmd.filter_gain,
+            native_volume=native_volume,
         )
         self._sounds[cmd.id] = managed
+        self._ticking[cmd.id] = managed
+        if scheduled_stop_frame is not None:
+            heapq.heappush(self._stop_heap, (scheduled_stop_frame, cmd.id))
+        self._poll_ids = None
 
     def _update_existing_sound(self, cmd: PatchCommand) -> None:
         """Update an existing sound's parameters."""
@@ -297,19 +464,29 @@ class CommandWorker:
         if not cmd.looping:
             managed.sound.set_looping(False)
 
-        # Update parameter sources for future updates
-        managed.volume_params = cmd.volume_params
-        managed.playback_rate = cmd.playback_rate
-
-        # Update filter_gain if present (LPF config itself is immutable)
-        if cmd.filter_gain is not None:
-            managed.filter_gain = cmd.filter_gain
+        # Update parameter sources for future updates.  filter_gain is only
+        # replaced if present (LPF config itself is immutable)
+        filter_gain = cmd.filter_gain
+        if filter_gain is None:
+            filter_gain = managed.filter_gain
+
+        # A native ramp is timed from the sound's start like the envelope, so
+        # resending the same ramp leaves it running in the fader.  Any other
+        # volume takes over in updates: their first fade replaces the fader's.
+        volume = cmd.volume_params.volume
+        native_volume = (
+            managed.native_volume
+            and isinstance(volume, TimeEnvelope)
+            and volume.linear_ramp() == managed.volume_params.volume.linear_ramp()
+        )
+        managed.set_parameters(cmd.volume_params, cmd.playback_rate, filter_gain, native_volume)
+        self._ticking[cmd.id] = managed
 
         # Note: We don't reset start_time, so parameters continue from
         # the original creation time. This matches the declarative model
         # where volume/pan/pitch are relative to sound start.
 
-    def _create_source(self, source_config) -> WaveformSource | DecoderSource | None:
+    def _create_source(self, source_config) -> WaveformSource | DecoderSource | PcmSource | None:
         """Create a source from configuration."""
         if source_config.kind == "waveform":
             return WaveformSource(
@@ -319,27 +496,67 @@ class CommandWorker:
             )
 
         elif source_config.kind == "encoded_bytes":
-            audio_bytes = self._bytes_cache.get(source_config.name)
-            return DecoderSource(audio_bytes)
+            name = source_config.name
+            pcm = self._pcm_cache.get(name)
+            if pcm is not None:
+                return PcmSource(pcm)
+
+            # Stream this play, and decode for the next one off this thread
+            audio_bytes = self._bytes_cache.get(name)
+            if self._cache_pcm and name not in self._decoding and name not in self._uncacheable:
+                self._decoding[name] = self._preloader.submit(self._preload, name, audio_bytes)
+            return DecoderSource(audio_bytes, sample_rate=self._engine.sample_rate)
 
         return None
 
-    def _update_sounds(self) -> None:
-        """Update all active sounds with time-based parameters and duration."""
-        current_time = self._engine.get_time_seconds()
+    def _update_sounds(self, current_frame: int) -> None:
+        """Update sounds that still have time-based parameters or a duration."""
+        current_time = current_frame * self._inv_sample_rate
 
-        for managed in self._sounds.values():
-            # Always update (handles duration checking even if params are constant)
+        idle = []
+        for sid, managed in self._ticking.items():
             managed.update(current_time)
+            if managed.is_idle():
+                idle.append(sid)
+        for sid in idle:
+            del self._ticking[sid]
 
-    def _cleanup_finished(self) -> None:
+    def _cleanup_finished(self, current_frame: int) -> None:
         """Remove finished sounds."""
-        current_frame = self._engine.get_time_frames()
-        finished_ids = [
-            sid for sid, managed in self._sounds.items()
-            if managed.is_finished(current_frame)
-        ]
-
+        # Duration stops happen in update(), so only ticking sounds have one
+        finished_ids = {
+            sid: None for sid, managed in self._ticking.items()
+            if managed.stopped_by_duration
+        }
+
+        stop_heap = self._stop_heap
+        while stop_heap and stop_heap[0][0] <= current_frame:
+            stop_frame, sid = heapq.heappop(stop_heap)
+            managed = self._sounds.get(sid)
+            # The id may since have been stopped, or reused by a new sound
+            if managed is not None and managed.scheduled_stop_frame == stop_frame:
+                finished_ids[sid] = None
+
+        # Sounds that played to their natural end, checked in one C call
+        poll_ids = self._poll_ids
+        if poll_ids is None:
+            poll_ids = self._rebuild_poll()
+        if poll_ids:
+            count = lib.sound_poll_finished(self._poll_sounds, len(poll_ids), self._poll_out)
+            for i in range(count):
+                finished_ids[poll_ids[self._poll_out[i]]] = None
+
+        if finished_ids:
+            self._poll_ids = None
         for sid in finished_ids:
             managed = self._sounds.pop(sid)
+            self._ticking.pop(sid, None)
             managed.sound.cleanup()
+
+    def _rebuild_poll(self) -> list[str]:
+        """Snapshot the current sounds for sound_poll_finished."""
+        self._poll_ids = list(self._sounds)
+        count = len(self._poll_ids)
+        self._poll_sounds = ffi.new("ma_sound*[]", [m.sound._ptr for m in self._sounds.values()])
+        self._poll_out = ffi.new("ma_uint32[]", count)
+        return self._poll_ids
@@ -37,6 +37,47 @@ static void panner_calculate_gains(float pan, float* left_gain, float* right_gai
     *right_gain = sinf(theta);
 }
 
+/*
+ * Equal-power gain table over the pan range, for the per-sample ramp.
+ * Entry i holds the gains for pan = i * 2 / PANNER_LUT_SIZE - 1; linear
+ * interpolation between entries is within 3e-7 of cosf/sinf.
+ */
+#define PANNER_LUT_SIZE 1024
+/* One spare entry past pan = 1, so a lookup there can still read i + 1 */
+static float g_panner_lut[PANNER_LUT_SIZE + 2][2];
+static ma_bool32 g_panner_lut_ready = MA_FALSE;
+
+/* Fill the gain table; called from panner_node_init before any panner runs */
+static void panner_init_lut(void) {
+    int i;
+
+    if (g_panner_lut_ready) {
+        return;
+    }
+
+    for (i = 0; i <= PANNER_LUT_SIZE; i++) {
+        panner_calculate_gains(
+            (float)i * (2.0f / PANNER_LUT_SIZE) - 1.0f,
+            &g_panner_lut[i][0],
+            &g_panner_lut[i][1]
+        );
+    }
+    g_panner_lut[PANNER_LUT_SIZE + 1][0] = g_panner_lut[PANNER_LUT_SIZE][0];
+    g_panner_lut[PANNER_LUT_SIZE + 1][1] = g_panner_lut[PANNER_LUT_SIZE][1];
+
+    g_panner_lut_ready = MA_TRUE;
+}
+
+/* Table lookup version of panner_calculate_gains (pan must be in [-1, 1]) */
+static MA_INLINE void panner_lookup_gains(float pan, float* left_gain, float* right_gain) {
+    float position = (pan + 1.0f) * (0.5f * PANNER_LUT_SIZE);
+    int i = (int)position;
+    float frac = position - (float)i;
+
+    *left_gain = g_panner_lut[i][0] + frac * (g_panner_lut[i + 1][0] - g_panner_lut[i][0]);
+    *right_gain = g_panner_lut[i][1] + frac * (g_panner_lut[i + 1][1] - g_panner_lut[i][1]);
+}
+
 /* Process callback - called from audio thread */
 static void panner_node_process_pcm_frames(
     ma_node* pNode,
@@ -72,27 +113,58 @@ static void panner_node_process_pcm_frames(
         pPanner->prev_pan = target_pan;
     }
 
-    /* Process frames */
-    for (iFrame = 0; iFrame < frameCount; iFrame++) {
-        float mono_sample = pFramesIn[iFrame];
-        float left_gain, right_gain;
+    /* Interpolating frames: the pan moves every sample */
+    iFrame = 0;
+    if (pPanner->smooth_samples_remaining > 0) {
+        ma_uint32 rampFrames = pPanner->smooth_samples_remaining;
+        ma_uint32 stepFrames;
+        ma_bool32 finishesRamp = rampFrames <= frameCount;
+
+        if (!finishesRamp) {
+            rampFrames = frameCount;
+        }
+        pPanner->smooth_samples_remaining -= rampFrames;
+
+        /* The final ramp frame snaps to the target, so keep it out of the loop */
+        stepFrames = finishesRamp ? rampFrames - 1 : rampFrames;
+
+        for (; iFrame < stepFrames; iFrame++) {
+            float mono_sample = pFramesIn[iFrame];
+            float left_gain, right_gain;
 
-        /* Update pan if interpolating */
-        if (pPanner->smooth_samples_remaining > 0) {
             pPanner->current_pan += pPanner->pan_increment;
-            pPanner->smooth_samples_remaining--;
+            panner_lookup_gains(pPanner->current_pan, &left_gain, &right_gain);
+
+            pFramesOut[iFrame * 2 + 0] = mono_sample * left_gain;
+            pFramesOut[iFrame * 2 + 1] = mono_sample * right_gain;
+        }
+
+        if (finishesRamp) {
+            float mono_sample = pFramesIn[iFrame];
+            float left_gain, right_gain;
 
             /* Snap to target at end of interpolation */
-            if (pPanner->smooth_samples_remaining == 0) {
-                pPanner->current_pan = pPanner->prev_pan;
-            }
+            pPanner->current_pan = pPanner->prev_pan;
+            panner_calculate_gains(pPanner->current_pan, &left_gain, &right_gain);
+
+            pFramesOut[iFrame * 2 + 0] = mono_sample * left_gain;
+            pFramesOut[iFrame * 2 + 1] = mono_sample * right_gain;
+            iFrame++;
         }
+    }
+
+    /* Steady frames: the pan is constant, so the gains only need computing once */
+    if (iFrame < frameCount) {
+        float left_gain, right_gain;
 
-        /* Calculate and apply gains */
         panner_calculate_gains(pPanner->current_pan, &left_gain, &right_gain);
 
-        pFramesOut[iFrame * 2 + 0] = mono_sample * left_gain;
-        pFramesOut[iFrame * 2 + 1] = mono_sample * right_gain;
+        for (; iFrame < frameCount; iFrame++) {
+            float mono_sample = pFramesIn[iFrame];
+
+            pFramesOut[iFrame * 2 + 0] = mono_sample * left_gain;
+            pFramesOut[iFrame * 2 + 1] = mono_sample * right_gain;
+        }
     }
 }
 
@@ -113,6 +185,7 @@ ma_result panner_node_init(
     }
 
     MA_ZERO_OBJECT(pPanner);
+    panner_init_lut();
 
     /* Clamp initial pan */
     if (initial_pan < -1.0f) initial_pan = -1.0f;
@@ -154,6 +227,25 @@ void panner_node_uninit(
     ma_node_uninit(&pPanner->base, pAllocationCallbacks);
 }
 
+/*
+ * Reset a detached panner for reuse, as if freshly initialized with this pan.
+ * Only safe while the node is not attached to the graph.
+ */
+void panner_node_reset(panner_node* pPanner, float pan) {
+    if (pPanner == NULL) {
+        return;
+    }
+
+    if (pan < -1.0f) pan = -1.0f;
+    if (pan > 1.0f) pan = 1.0f;
+
+    panner_atomic_store_f32(&pPanner->target_pan, pan);
+    pPanner->prev_pan = pan;
+    pPanner->current_pan = pan;
+    pPanner->smooth_samples_remaining = 0;
+    pPanner->pan_increment = 0.0f;
+}
+
 /* Set the pan value (thread-safe, can be called from any thread) */
 void panner_node_set_pan(panner_node* pPanner, float pan) {
     if (pPanner == NULL) {
@@ -167,6 +259,19 @@ void panner_node_set_pan(panner_node* pPanner, float pan) {
     panner_atomic_store_f32(&pPanner->target_pan, pan);
 }
 
+/*
+ * Blend an unfiltered/filtered panner pair: the unfiltered panner's output
+ * gets (1 - filter_gain), the filtered one filter_gain.
+ */
+void panner_node_set_blend(panner_node* pUnfiltered, panner_node* pFiltered, float filter_gain) {
+    if (pUnfiltered == NULL || pFiltered == NULL) {
+        return;
+    }
+
+    ma_node_set_output_bus_volume(&pUnfiltered->base, 0, 1.0f - filter_gain);
+    ma_node_set_output_bus_volume(&pFiltered->base, 0, filter_gain);
+}
+
 /* Get the current target pan value (thread-safe) */
 float panner_node_get_pan(const panner_node* pPanner) {
     if (pPanner == NULL) {
@@ -93,9 +93,15 @@ void panner_node_uninit(
     const ma_allocation_callbacks* pAllocationCallbacks
 );
 
+/* Reset a detached panner for reuse, as if freshly initialized with this pan */
+void panner_node_reset(panner_node* pPanner, float pan);
+
 /* Set the pan value (thread-safe, can be called from any thread) */
 void panner_node_set_pan(panner_node* pPanner, float pan);
 
+/* Blend an unfiltered/filtered panner pair by the filtered branch's gain */
+void panner_node_set_blend(panner_node* pUnfiltered, panner_node* pFiltered, float filter_gain);
+
 /* Get the current target pan value (thread-safe) */
 float panner_node_get_pan(const panner_node* pPanner);
 
@@ -0,0 +1,193 @@
+/*
+ * sine_osc.c - Trig-free sine oscillator data source for miniaudio
+ *
+ * This file is included by the CFFI build after miniaudio.h
+ *
+ * The magic circle recurrence
+ *
+ *     x[n+1] = x[n] - e * y[n]
+ *     y[n+1] = y[n] + e * x[n+1]
+ *
+ * with e = 2 * sin(w / 2) rotates by exactly w radians per step, and
+ * y[n] = sin(phase + n * w) when seeded with y[0] = sin(phase) and
+ * x[0] = cos(phase - w / 2).  It is numerically stable (the update matrix has
+ * determinant 1), and we reseed it from the phase accumulator every read,
+ * so the only per-sample work is two multiply-adds.
+ */
+
+#include "sine_osc.h"
+#include <math.h>
+
+#ifndef M_PI
+#define M_PI 3.14159265358979323846
+#endif
+
+static ma_result sine_osc__on_read(ma_data_source* pDataSource, void* pFramesOut, ma_uint64 frameCount, ma_uint64* pFramesRead)
+{
+    return sine_osc_read_pcm_frames((sine_osc*)pDataSource, pFramesOut, frameCount, pFramesRead);
+}
+
+static ma_result sine_osc__on_seek(ma_data_source* pDataSource, ma_uint64 frameIndex)
+{
+    return sine_osc_seek_to_pcm_frame((sine_osc*)pDataSource, frameIndex);
+}
+
+static ma_result sine_osc__on_get_data_format(ma_data_source* pDataSource, ma_format* pFormat, ma_uint32* pChannels, ma_uint32* pSampleRate, ma_channel* pChannelMap, size_t channelMapCap)
+{
+    sine_osc* pOsc = (sine_osc*)pDataSource;
+
+    *pFormat     = ma_format_f32;
+    *pChannels   = 1;
+    *pSampleRate = pOsc->sample_rate;
+    ma_channel_map_init_standard(ma_standard_channel_map_default, pChannelMap, channelMapCap, 1);
+
+    return MA_SUCCESS;
+}
+
+static ma_result sine_osc__on_get_cursor(ma_data_source* pDataSource, ma_uint64* pCursor)
+{
+    *pCursor = ((sine_osc*)pDataSource)->cursor;
+    return MA_SUCCESS;
+}
+
+/* Data source vtable */
+static ma_data_source_vtable g_sine_osc_vtable = {
+    sine_osc__on_read,
+    sine_osc__on_seek,
+    sine_osc__on_get_data_format,
+    sine_osc__on_get_cursor,
+    NULL,   /* onGetLength - oscillators have no length */
+    NULL,   /* onSetLooping */
+    0
+};
+
+/* Initialize a sine oscillator (mono, f32) */
+ma_result sine_osc_init(
+    ma_uint32 sample_rate,
+    double frequency,
+    double amplitude,
+    sine_osc* pOsc
+) {
+    ma_result result;
+    ma_data_source_config dataSourceConfig;
+
+    if (pOsc == NULL || sample_rate == 0) {
+        return MA_INVALID_ARGS;
+    }
+
+    MA_ZERO_OBJECT(pOsc);
+
+    dataSourceConfig = ma_data_source_config_init();
+    dataSourceConfig.vtable = &g_sine_osc_vtable;
+
+    result = ma_data_source_init(&dataSourceConfig, &pOsc->base);
+    if (result != MA_SUCCESS) {
+        return result;
+    }
+
+    pOsc->sample_rate = sample_rate;
+    pOsc->amplitude = amplitude;
+    pOsc->time = 0.0;
+    pOsc->cursor = 0;
+    sine_osc_set_frequency(pOsc, frequency);
+
+    return MA_SUCCESS;
+}
+
+/* Uninitialize a sine oscillator */
+void sine_osc_uninit(sine_osc* pOsc)
+{
+    if (pOsc == NULL) {
+        return;
+    }
+
+    ma_data_source_uninit(&pOsc->base);
+}
+
+/* Read mono f32 frames - called from audio thread */
+ma_result sine_osc_read_pcm_frames(
+    sine_osc* pOsc,
+    void* pFramesOut,
+    ma_uint64 frameCount,
+    ma_uint64* pFramesRead
+) {
+    float* pFramesOutF32 = (float*)pFramesOut;
+    double phase;
+    double x, y;
+    double e, amplitude;
+    ma_uint64 iFrame;
+
+    if (pFramesRead != NULL) {
+        *pFramesRead = 0;
+    }
+
+    if (pOsc == NULL || frameCount == 0) {
+        return MA_INVALID_ARGS;
+    }
+
+    e = pOsc->epsilon;
+
+    if (pFramesOutF32 != NULL) {
+        /* Seed the recurrence from the phase accumulator */
+        phase = 2.0 * M_PI * pOsc->time;
+        y = sin(phase);
+        x = cos(phase - M_PI * pOsc->advance);
+        amplitude = pOsc->amplitude;
+
+        for (iFrame = 0; iFrame < frameCount; iFrame++) {
+            pFramesOutF32[iFrame] = (float)(y * amplitude);
+            x -= e * y;
+            y += e * x;
+        }
+    }
+
+    /* Advance and wrap the phase so it never loses precision */
+    pOsc->time += pOsc->advance * (double)frameCount;
+    pOsc->time -= floor(pOsc->time);
+    pOsc->cursor += frameCount;
+
+    if (pFramesRead != NULL) {
+        *pFramesRead = frameCount;
+    }
+
+    return MA_SUCCESS;
+}
+
+/* Seek to a frame */
+ma_result sine_osc_seek_to_pcm_frame(sine_osc* pOsc, ma_uint64 frameIndex)
+{
+    if (pOsc == NULL) {
+        return MA_INVALID_ARGS;
+    }
+
+    pOsc->time = pOsc->advance * (double)frameIndex;
+    pOsc->time -= floor(pOsc->time);
+    pOsc->cursor = frameIndex;
+
+    return MA_SUCCESS;
+}
+
+/* Change frequency */
+ma_result sine_osc_set_frequency(sine_osc* pOsc, double frequency)
+{
+    if (pOsc == NULL) {
+        return MA_INVALID_ARGS;
+    }
+
+    pOsc->advance = frequency / (double)pOsc->sample_rate;
+    pOsc->epsilon = 2.0 * sin(M_PI * pOsc->advance);
+
+    return MA_SUCCESS;
+}
+
+/* Change amplitude */
+ma_result sine_osc_set_amplitude(sine_osc* pOsc, double amplitude)
+{
+    if (pOsc == NULL) {
+        return MA_INVALID_ARGS;
+    }
+
+    pOsc->amplitude = amplitude;
+
+    return MA_SUCCESS;
+}
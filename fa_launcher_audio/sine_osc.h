@@ -0,0 +1,73 @@
+/*
+ * sine_osc.h - Trig-free sine oscillator data source for miniaudio
+ *
+ * Drop-in replacement for ma_waveform's sine type (mono f32 only):
+ * - Samples come from the "magic circle" recurrence, two multiply-adds per
+ *   sample instead of a sin() call
+ * - The recurrence is reseeded from a double-precision phase at the start of
+ *   each read, so error cannot accumulate across blocks
+ */
+
+#ifndef SINE_OSC_H
+#define SINE_OSC_H
+
+#include "miniaudio.h"
+
+#ifdef __cplusplus
+extern "C" {
+#endif
+
+/* Sine oscillator structure - ma_data_source_base MUST be first member */
+typedef struct {
+    ma_data_source_base base;
+
+    ma_uint32 sample_rate;
+    double amplitude;
+
+    /* Phase advance per frame, in cycles */
+    double advance;
+
+    /* Current phase in cycles, kept in [0, 1) */
+    double time;
+
+    /* Recurrence coefficient: 2 * sin(pi * advance) */
+    double epsilon;
+
+    /* Frames read since the last seek (for the data source cursor) */
+    ma_uint64 cursor;
+} sine_osc;
+
+/* Initialize a sine oscillator (mono, f32) */
+ma_result sine_osc_init(
+    ma_uint32 sample_rate,
+    double frequency,
+    double amplitude,
+    sine_osc* pOsc
+);
+
+/* Uninitialize a sine oscillator */
+void sine_osc_uninit(sine_osc* pOsc);
+
+/* Read mono f32 frames */
+ma_result sine_osc_read_pcm_frames(
+    sine_osc* pOsc,
+    void* pFramesOut,
+    ma_uint64 frameCount,
+    ma_uint64* pFramesRead
+);
+
+/* Seek to a frame; the phase is the same as if that many frames were read */
+ma_result sine_osc_seek_to_pcm_frame(sine_osc* pOsc, ma_uint64 frameIndex);
+
+/*
+ * Change frequency/amplitude.  Like ma_waveform these are not synchronised
+ * with the audio thread; the change takes effect on the next read.
+ */
+ma_result sine_osc_set_frequency(sine_osc* pOsc, double frequency);
+ma_result sine_osc_set_amplitude(sine_osc* pOsc, double amplitude);
+
+#ifdef __cplusplus
+}
+#endif
+
+#endif /* SINE_OSC_H */
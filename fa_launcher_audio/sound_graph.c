@@ -0,0 +1,68 @@
+/*
+ * sound_graph.c - Node graph wiring for a sound's output path
+ *
+ * This file is included by the CFFI build after miniaudio.h and
+ * panner_node.c
+ */
+
+#include "sound_graph.h"
+
+ma_result sound_graph_attach(ma_sound* pSound, panner_node* pPanner, ma_node* pEndpoint)
+{
+    ma_result result;
+
+    result = ma_node_attach_output_bus(pSound, 0, pPanner, 0);
+    if (result != MA_SUCCESS) {
+        return result;
+    }
+
+    return ma_node_attach_output_bus(pPanner, 0, pEndpoint, 0);
+}
+
+ma_result sound_graph_attach_lpf(
+    ma_sound* pSound,
+    ma_splitter_node* pSplitter,
+    ma_lpf_node* pLpf,
+    panner_node* pPanner,
+    panner_node* pPannerFiltered,
+    ma_node* pEndpoint
+) {
+    ma_result result;
+
+    /* sound -> splitter */
+    result = ma_node_attach_output_bus(pSound, 0, pSplitter, 0);
+    if (result != MA_SUCCESS) {
+        return result;
+    }
+
+    /* splitter output 0 -> panner (unfiltered path) */
+    result = ma_node_attach_output_bus(pSplitter, 0, pPanner, 0);
+    if (result != MA_SUCCESS) {
+        return result;
+    }
+
+    /* splitter output 1 -> lpf */
+    result = ma_node_attach_output_bus(pSplitter, 1, pLpf, 0);
+    if (result != MA_SUCCESS) {
+        return result;
+    }
+
+    /* lpf -> panner_filtered */
+    result = ma_node_attach_output_bus(pLpf, 0, pPannerFiltered, 0);
+    if (result != MA_SUCCESS) {
+        return result;
+    }
+
+    /* both panners -> endpoint */
+    result = ma_node_attach_output_bus(pPanner, 0, pEndpoint, 0);
+    if (result != MA_SUCCESS) {
+        return result;
+    }
+
+    return ma_node_attach_output_bus(pPannerFiltered, 0, pEndpoint, 0);
+}
+
+void sound_graph_set_initial_volume(ma_sound* pSound, float volume)
+{
+    ma_fader_set_fade(&pSound->engineNode.fader, volume, volume, 0);
+}
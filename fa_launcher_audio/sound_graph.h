@@ -0,0 +1,58 @@
+/*
+ * sound_graph.h - Node graph wiring for a sound's output path
+ *
+ * Sound wires its nodes together once at creation.  Doing every attachment
+ * in one call keeps that to a single Python-to-C crossing (and one result
+ * check) instead of one per edge.
+ */
+
+#ifndef SOUND_GRAPH_H
+#define SOUND_GRAPH_H
+
+#include "miniaudio.h"
+#include "panner_node.h"
+
+#ifdef __cplusplus
+extern "C" {
+#endif
+
+/*
+ * Wire the single path: sound -> panner -> endpoint.
+ *
+ * Returns the first failing result, or MA_SUCCESS.
+ */
+ma_result sound_graph_attach(ma_sound* pSound, panner_node* pPanner, ma_node* pEndpoint);
+
+/*
+ * Wire the dual LPF path:
+ *
+ *     sound -> splitter -> panner ----------------> endpoint
+ *                       -> lpf -> panner_filtered -> endpoint
+ *
+ * Returns the first failing result, or MA_SUCCESS.  Edges attached before a
+ * failure stay attached; uninitializing the nodes detaches them.
+ */
+ma_result sound_graph_attach_lpf(
+    ma_sound* pSound,
+    ma_splitter_node* pSplitter,
+    ma_lpf_node* pLpf,
+    panner_node* pPanner,
+    panner_node* pPannerFiltered,
+    ma_node* pEndpoint
+);
+
+/*
+ * Set the sound's fader to a fixed volume, taking effect from its first
+ * frame.  ma_sound_set_fade_* only queues a fade for the audio thread,
+ * where a later queued fade would replace it; this writes the fader itself.
+ *
+ * Only call this before the sound is started: after that the fader belongs
+ * to the audio thread.
+ */
+void sound_graph_set_initial_volume(ma_sound* pSound, float volume);
+
+#ifdef __cplusplus
+}
+#endif
+
+#endif /* SOUND_GRAPH_H */
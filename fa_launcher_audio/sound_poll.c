@@ -0,0 +1,38 @@
+/*
+ * sound_poll.c - Batch end-of-playback checks for many sounds
+ *
+ * This file is included by the CFFI build after miniaudio.h
+ */
+
+#include "sound_poll.h"
+
+ma_uint32 sound_poll_finished(ma_sound** ppSounds, ma_uint32 count, ma_uint32* pFinishedOut)
+{
+    ma_uint32 iSound;
+    ma_uint32 finishedCount = 0;
+
+    if (ppSounds == NULL || pFinishedOut == NULL) {
+        return 0;
+    }
+
+    for (iSound = 0; iSound < count; iSound++) {
+        ma_sound* pSound = ppSounds[iSound];
+
+        if (!ma_sound_is_looping(pSound) && ma_sound_at_end(pSound)) {
+            pFinishedOut[finishedCount++] = iSound;
+        }
+    }
+
+    return finishedCount;
+}
+
+ma_bool32 sound_poll_source_reached(void* pDataSource, ma_uint64 endFrame)
+{
+    ma_uint64 cursor;
+
+    if (ma_data_source_get_cursor_in_pcm_frames((ma_data_source*)pDataSource, &cursor) != MA_SUCCESS) {
+        return MA_FALSE;
+    }
+
+    return cursor >= endFrame;
+}
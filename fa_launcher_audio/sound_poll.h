@@ -0,0 +1,38 @@
+/*
+ * sound_poll.h - Batch end-of-playback checks for many sounds
+ *
+ * The worker checks every active sound for a natural end on every tick.
+ * Doing that in one call keeps it to a single Python-to-C crossing instead
+ * of one (plus a method call) per sound.
+ */
+
+#ifndef SOUND_POLL_H
+#define SOUND_POLL_H
+
+#include "miniaudio.h"
+
+#ifdef __cplusplus
+extern "C" {
+#endif
+
+/*
+ * Find the sounds that have played to the end and are not looping.
+ *
+ * Writes the indices (into ppSounds) of finished sounds to pFinishedOut,
+ * which must have room for count entries, and returns how many there are.
+ */
+ma_uint32 sound_poll_finished(ma_sound** ppSounds, ma_uint32 count, ma_uint32* pFinishedOut);
+
+/*
+ * Check whether a data source's read cursor has reached endFrame.
+ *
+ * Used for duration-limited generators, which have no length of their own.
+ * Returns false if the source cannot report a cursor.
+ */
+ma_bool32 sound_poll_source_reached(void* pDataSource, ma_uint64 endFrame);
+
+#ifdef __cplusplus
+}
+#endif
+
+#endif /* SOUND_POLL_H */
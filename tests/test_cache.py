@@ -0,0 +1,104 @@
+"""Tests for the bytes cache."""
+
+from fa_launcher_audio._internals.cache import BytesCache, PcmCache
+
+
+class CountingProvider:
+    def __init__(self):
+        self.calls = []
+
+    def __call__(self, name: str) -> bytes:
+        self.calls.append(name)
+        return bytes(100 if name == "big" else 10)
+
+
+class TestBytesCache:
+    def test_hit_does_not_reload(self):
+        provider = CountingProvider()
+        cache = BytesCache(provider)
+        cache.get("a")
+        cache.get("a")
+        assert provider.calls == ["a"]
+
+    def test_evicts_least_recently_used(self):
+        provider = CountingProvider()
+        cache = BytesCache(provider, max_bytes=20)
+        cache.get("a")
+        cache.get("b")
+        cache.get("a")  # b is now least recently used
+        cache.get("c")
+        cache.get("a")
+        cache.get("b")
+        assert provider.calls == ["a", "b", "c", "b"]
+
+    def test_oversized_entry_not_kept(self):
+        provider = CountingProvider()
+        cache = BytesCache(provider, max_bytes=50)
+        cache.get("a")
+        cache.get("b")
+        assert cache.get("big") == bytes(100)
+        cache.get("big")
+        # Entries already cached survive
+        cache.get("a")
+        cache.get("b")
+        assert provider.calls == ["a", "b", "big", "big"]
+
+    def test_discard(self):
+        provider = CountingProvider()
+        cache = BytesCache(provider)
+        cache.get("a")
+        cache.get("b")
+        cache.discard("a")
+        cache.discard("missing")
+        cache.get("a")
+        cache.get("b")
+        assert provider.calls == ["a", "b", "a"]
+
+    def test_clear(self):
+        provider = CountingProvider()
+        cache = BytesCache(provider)
+        cache.get("a")
+        cache.clear()
+        cache.get("a")
+        assert provider.calls == ["a", "a"]
+
+
+class FakePcm:
+    def __init__(self, nbytes: int = 10):
+        self.nbytes = nbytes
+
+
+class TestPcmCache:
+    def test_miss_returns_none(self):
+        assert PcmCache().get("a") is None
+
+    def test_hit_shares_decoded_audio(self):
+        cache = PcmCache()
+        pcm = FakePcm()
+        assert cache.put("a", pcm)
+        assert cache.get("a") is pcm
+
+    def test_evicts_least_recently_used(self):
+        cache = PcmCache(max_bytes=20)
+        cache.put("a", FakePcm())
+        cache.put("b", FakePcm())
+        cache.get("a")  # b is now least recently used
+        cache.put("c", FakePcm())
+        assert cache.get("a") is not None
+        assert cache.get("b") is None
+        assert cache.get("c") is not None
+
+    def test_oversized_entry_not_kept(self):
+        cache = PcmCache(max_bytes=50)
+        cache.put("a", FakePcm())
+        cache.put("b", FakePcm())
+        assert not cache.put("big", FakePcm(100))
+        assert cache.get("big") is None
+        # Entries already cached survive
+        assert cache.get("a") is not None
+        assert cache.get("b") is not None
+
+    def test_zero_budget_keeps_nothing(self):
+        cache = PcmCache(max_bytes=0)
+        assert not cache.put("a", FakePcm())
+        assert cache.get("a") is None
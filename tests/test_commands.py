@@ -3,7 +3,9 @@
 import pytest
 from fa_launcher_audio._internals.commands import (
     parse_command,
+    prepare_command,
     validate_command,
+    validate_command_fast,
     PatchCommand,
     StopCommand,
     CompoundCommand,
@@ -119,6 +121,20 @@ class TestParseCommand:
         })
         assert cmd.source.fade_out == 0.1
 
+    def test_parse_repeated_json_is_memoized(self):
+        data = '{"command": "patch", "id": "ping", "source": {"kind": "waveform", "waveform": "sine", "frequency": 440}}'
+        assert parse_command(data) is parse_command(data)
+
+    def test_parse_json_bytes(self):
+        cmd = parse_command(b'{"command": "stop", "id": "test"}')
+        assert isinstance(cmd, StopCommand)
+        assert cmd.id == "test"
+
+    def test_parsed_command_is_frozen(self):
+        cmd = parse_command('{"command": "stop", "id": "test"}')
+        with pytest.raises(AttributeError):
+            cmd.id = "other"
+
     def test_parse_unknown_command_raises(self):
         with pytest.raises(ValueError, match="Unknown command type"):
             parse_command({"command": "unknown"})
@@ -162,6 +178,29 @@ class TestValidateCommand:
         errors = validate_command(cmd)
         assert any("frequency" in e.lower() for e in errors)
 
+    def test_validate_nested_compound_prefixes_errors(self):
+        cmd = parse_command({
+            "command": "compound",
+            "commands": [
+                {"command": "stop", "id": "ok"},
+                {"command": "compound", "commands": [{"command": "stop", "id": ""}]},
+            ],
+        })
+        errors = validate_command(cmd)
+        assert errors == ["sub-command 1: sub-command 0: Stop command missing id"]
+
+    def test_validate_fast_matches_validate(self):
+        valid = parse_command({
+            "command": "compound",
+            "commands": [{"command": "stop", "id": "sound1"}],
+        })
+        invalid = parse_command({
+            "command": "compound",
+            "commands": [{"command": "stop", "id": ""}],
+        })
+        assert validate_command_fast(valid) is True
+        assert validate_command_fast(invalid) is False
+
     def test_encoded_bytes_missing_name(self):
         cmd = parse_command({
             "command": "patch",
@@ -196,6 +235,17 @@ class TestValidateCommand:
         errors = validate_command(cmd)
         assert any("fade_out" in e.lower() and "exceeds" in e.lower() for e in errors)
 
+    def test_prepare_command_validates(self):
+        cmd = prepare_command({"command": "stop", "id": "test"})
+        assert cmd == StopCommand(id="test")
+        with pytest.raises(ValueError, match="start_time"):
+            prepare_command({
+                "command": "patch",
+                "id": "test",
+                "source": {"kind": "waveform", "waveform": "sine", "frequency": 440},
+                "start_time": -1.0,
+            })
+
 
 class TestCompoundCommand:
     def test_parse_compound_command(self):
@@ -235,6 +285,38 @@ class TestCompoundCommand:
         assert isinstance(cmd, CompoundCommand)
         assert all(isinstance(c, StopCommand) for c in cmd.commands)
 
+    def test_parse_nested_compound(self):
+        cmd = parse_command({
+            "command": "compound",
+            "commands": [
+                {"command": "stop", "id": "sound1"},
+                {"command": "compound", "commands": [{"command": "stop", "id": "sound2"}]},
+            ],
+        })
+        assert isinstance(cmd.commands[1], CompoundCommand)
+        assert cmd.commands[1].commands[0].id == "sound2"
+
+    def test_compound_accepts_json_sub_commands(self):
+        cmd = parse_command({
+            "command": "compound",
+            "commands": [
+                '{"command": "stop", "id": "sound1"}',
+                b'{"command": "compound", "commands": [{"command": "stop", "id": "sound2"}]}',
+            ],
+        })
+        assert cmd.commands[0] == StopCommand(id="sound1")
+        assert cmd.commands[1].commands[0].id == "sound2"
+
+    def test_parse_deeply_nested_compound(self):
+        data = {"command": "stop", "id": "innermost"}
+        for _ in range(5000):
+            data = {"command": "compound", "commands": [data]}
+        cmd = parse_command(data)
+        for _ in range(5000):
+            assert isinstance(cmd, CompoundCommand)
+            cmd = cmd.commands[0]
+        assert cmd.id == "innermost"
+
     def test_validate_empty_compound(self):
         cmd = parse_command({
             "command": "compound",
@@ -1,13 +1,19 @@
 """Integration tests for the audio system."""
 
+import math
 import pytest
+import sys
 import time
 from pathlib import Path
 
 from fa_launcher_audio import AudioManager
 from fa_launcher_audio._internals.engine import MiniaudioEngine
-from fa_launcher_audio._internals.sources import WaveformSource, DecoderSource
+from fa_launcher_audio._internals.sources import WaveformSource, DecoderSource, DecodedPcm, PcmSource
 from fa_launcher_audio._internals.sound import Sound
+from fa_launcher_audio._internals.parameters import StaticParam, VolumeParams, parse_param
+from fa_launcher_audio._internals.worker import CommandWorker, ManagedSound
+from fa_launcher_audio._internals.cache import BytesCache
+from fa_launcher_audio._internals.commands import CompoundCommand, StopCommand, parse_command
 
 
 class TestMiniaudioEngine:
@@ -42,6 +48,42 @@ class TestWaveformSource:
             assert wf._initialized
             wf.cleanup()
 
+    def test_sine_matches_reference(self):
+        from fa_launcher_audio._audio_cffi import ffi, lib
+
+        wf = WaveformSource("sine", 440.0, amplitude=0.5)
+        frames = ffi.new("float[20000]")
+        frames_read = ffi.new("ma_uint64*")
+        # Read in uneven blocks, then check continuity against sin()
+        offset = 0
+        for count in (1, 480, 4096, 15423):
+            lib.sine_osc_read_pcm_frames(wf._waveform, frames + offset, count, frames_read)
+            offset += count
+        for i in range(20000):
+            expected = 0.5 * math.sin(2 * math.pi * 440.0 * i / 44100)
+            assert frames[i] == pytest.approx(expected, abs=1e-6)
+        wf.cleanup()
+
+    def test_duration_finishes_on_read_cursor(self):
+        from fa_launcher_audio._audio_cffi import ffi, lib
+
+        frames = ffi.new("float[1000]")
+        frames_read = ffi.new("ma_uint64*")
+        for wf_type in ["sine", "triangle"]:
+            wf = WaveformSource(wf_type, 440.0, duration_seconds=1000 / 44100)
+            read = lib.sine_osc_read_pcm_frames if wf_type == "sine" else lib.ma_waveform_read_pcm_frames
+            read(wf._waveform, frames, 999, frames_read)
+            assert not wf.is_finished
+            read(wf._waveform, frames, 1, frames_read)
+            assert wf.is_finished
+            wf.reset()
+            assert not wf.is_finished
+            wf.cleanup()
+
+        wf = WaveformSource("sine", 440.0)
+        assert not wf.is_finished
+        wf.cleanup()
+
     def test_waveform_invalid_type(self):
         with pytest.raises(ValueError):
             WaveformSource("invalid", 440.0)
@@ -56,6 +98,30 @@ class TestDecoderSource:
         decoder.cleanup()
 
 
+class TestPcmSource:
+    def test_decoded_pcm_matches_decoder_length(self, test_audio_bytes):
+        decoder = DecoderSource(test_audio_bytes)
+        pcm = DecodedPcm.decode(test_audio_bytes, DecoderSource.SAMPLE_RATE)
+        assert pcm.frames == decoder.get_length_frames()
+        assert pcm.nbytes == pcm.frames * 4
+        decoder.cleanup()
+
+    def test_sources_share_pcm_and_play_to_end(self, test_audio_bytes):
+        engine = MiniaudioEngine(no_device=True)
+        pcm = DecodedPcm.decode(test_audio_bytes, engine.sample_rate)
+        sounds = [Sound(engine, PcmSource(pcm), f"s{i}") for i in range(2)]
+        assert sounds[0]._source.get_data_source_ptr() != sounds[1]._source.get_data_source_ptr()
+
+        for sound in sounds:
+            sound.start()
+        engine.read_frames(pcm.frames + 480)
+        assert all(sound.is_finished() for sound in sounds)
+
+        for sound in sounds:
+            sound.cleanup()
+        engine.uninit()
+
+
 class TestSound:
     def test_sound_creates_from_waveform(self):
         engine = MiniaudioEngine()
@@ -78,6 +144,524 @@ class TestSound:
         sound.cleanup()
         engine.uninit()
 
+    def test_unchanged_pan_skips_native_call(self):
+        from fa_launcher_audio._audio_cffi import lib
+
+        engine = MiniaudioEngine()
+        wf = WaveformSource("sine", 440.0)
+        sound = Sound(engine, wf, "test")
+
+        sound.set_pan(0.5)
+        assert lib.panner_node_get_pan(sound._panner) == 0.5
+        lib.panner_node_set_pan(sound._panner, 0.0)
+        sound.set_pan(0.5)
+        assert lib.panner_node_get_pan(sound._panner) == 0.0
+
+        sound.cleanup()
+        engine.uninit()
+
+    def test_out_of_range_pan_is_clamped_natively(self):
+        from fa_launcher_audio._audio_cffi import lib
+
+        engine = MiniaudioEngine()
+        sound = Sound(engine, WaveformSource("sine", 440.0), "test", initial_pan=-3.0)
+        assert lib.panner_node_get_pan(sound._panner) == -1.0
+
+        sound.set_pan(2.5)
+        assert lib.panner_node_get_pan(sound._panner) == 1.0
+
+        sound.cleanup()
+        engine.uninit()
+
+    def test_pan_ramp_settles_on_target(self):
+        import struct
+
+        engine = MiniaudioEngine(no_device=True)
+        sound = Sound(engine, WaveformSource("square", 440.0), "test")
+        sound.start()
+        engine.read_frames(100)
+
+        sound.set_pan(1.0)
+        # Uneven blocks so the ramp ends partway through a block
+        for count in (7, 100, 300, 1000):
+            data = engine.read_frames(count)
+        samples = struct.unpack(f"{len(data) // 4}f", data)
+        left, right = samples[-2], samples[-1]
+        assert abs(left) < 1e-6
+        assert abs(right) == pytest.approx(1.0)
+
+        sound.cleanup()
+        engine.uninit()
+
+    def test_pan_ramp_follows_equal_power_curve(self):
+        import struct
+
+        engine = MiniaudioEngine(no_device=True)
+        sound = Sound(engine, WaveformSource("square", 1.0), "test", initial_pan=-1.0)
+        sound.start()
+        # One full node graph block, so the pan change lands on a block start
+        engine.read_frames(480)
+
+        sound.set_pan(1.0)
+        data = engine.read_frames(480)
+        samples = struct.unpack(f"{len(data) // 4}f", data)
+        for i in range(255):
+            theta = (i + 1) / 256 * math.pi / 2
+            assert abs(samples[2 * i]) == pytest.approx(math.cos(theta), abs=1e-6)
+            assert abs(samples[2 * i + 1]) == pytest.approx(math.sin(theta), abs=1e-6)
+
+        sound.cleanup()
+        engine.uninit()
+
+    def test_panners_are_reused(self):
+        from fa_launcher_audio._audio_cffi import lib
+
+        engine = MiniaudioEngine()
+        sound = Sound(engine, WaveformSource("sine", 440.0), "a", lpf_cutoff=500.0)
+        sound.set_filter_gain(1.0)
+        panners = {sound._panner, sound._panner_filtered}
+        sound.cleanup()
+        assert len(engine._panner_pool) == 2
+
+        sound = Sound(engine, WaveformSource("sine", 440.0), "b", initial_pan=-0.5)
+        assert sound._panner in panners
+        assert lib.panner_node_get_pan(sound._panner) == -0.5
+        assert lib.ma_node_get_state(sound._panner) == lib.ma_node_state_started
+        assert lib.ma_node_get_output_bus_volume(sound._panner, 0) == 1.0
+
+        sound.cleanup()
+        engine.uninit()
+        assert engine._panner_pool == []
+
+    def test_sound_buffer_is_reused(self):
+        engine = MiniaudioEngine()
+        sound = Sound(engine, WaveformSource("sine", 440.0), "a")
+        buffer = sound._sound
+        sound.cleanup()
+        assert sound._sound is None
+
+        sound = Sound(engine, WaveformSource("sine", 440.0), "b")
+        assert sound._sound is buffer
+        assert sound.is_playing() is False
+
+        sound.cleanup()
+        engine.uninit()
+
+    def test_lpf_node_buffers_are_reused(self):
+        engine = MiniaudioEngine()
+        sound = Sound(engine, WaveformSource("sine", 440.0), "a", lpf_cutoff=500.0)
+        splitter, lpf_node = sound._splitter, sound._lpf_node
+        sound.cleanup()
+
+        sound = Sound(engine, WaveformSource("sine", 440.0), "b", lpf_cutoff=2000.0)
+        assert sound._splitter is splitter
+        assert sound._lpf_node is lpf_node
+        sound.set_filter_gain(0.5)
+
+        sound.cleanup()
+        engine.uninit()
+
+    def test_filter_gain_stops_silent_branch(self):
+        from fa_launcher_audio._audio_cffi import lib
+
+        engine = MiniaudioEngine()
+        wf = WaveformSource("sine", 440.0)
+        sound = Sound(engine, wf, "test", lpf_cutoff=500.0)
+
+        sound.set_filter_gain(1.0)
+        assert lib.ma_node_get_state(sound._panner) == lib.ma_node_state_stopped
+        assert lib.ma_node_get_state(sound._panner_filtered) == lib.ma_node_state_started
+
+        sound.set_filter_gain(0.25)
+        assert lib.ma_node_get_output_bus_volume(sound._panner, 0) == 0.75
+        assert lib.ma_node_get_output_bus_volume(sound._panner_filtered, 0) == 0.25
+
+        sound.set_filter_gain(0.5)
+        assert lib.ma_node_get_state(sound._panner) == lib.ma_node_state_started
+        assert lib.ma_node_get_state(sound._panner_filtered) == lib.ma_node_state_started
+
+        sound.set_filter_gain(0.0)
+        assert lib.ma_node_get_state(sound._panner_filtered) == lib.ma_node_state_stopped
+
+        sound.cleanup()
+        engine.uninit()
+
+
+class TestManagedSound:
+    def _make(self, volume):
+        engine = MiniaudioEngine()
+        sound = Sound(engine, WaveformSource("sine", 440.0), "test")
+        managed = ManagedSound(
+            sound=sound,
+            volume_params=VolumeParams(volume=volume, pan=StaticParam(0.0)),
+            playback_rate=StaticParam(1.0),
+            start_time=0.0,
+        )
+        return engine, sound, managed
+
+    def test_constant_params_applied_once(self):
+        engine, sound, managed = self._make(StaticParam(0.5))
+        managed.update(0.0)
+        assert sound._volume == 0.5
+
+        sound._volume = None
+        managed.update(0.1)
+        assert sound._volume is None
+
+        sound.cleanup()
+        engine.uninit()
+
+    def test_envelope_params_applied_every_update(self):
+        envelope = parse_param([{"time": 0.0, "value": 0.0}, {"time": 1.0, "value": 1.0}])
+        engine, sound, managed = self._make(envelope)
+        managed.update(0.25)
+        managed.update(0.5)
+        assert sound._volume == pytest.approx(0.5)
+
+        sound.cleanup()
+        engine.uninit()
+
+    def test_set_parameters_reapplies(self):
+        engine, sound, managed = self._make(StaticParam(0.5))
+        managed.update(0.0)
+        managed.set_parameters(
+            VolumeParams(volume=StaticParam(0.25), pan=StaticParam(0.0)),
+            StaticParam(1.0),
+            None,
+        )
+        managed.update(0.1)
+        assert sound._volume == 0.25
+
+        sound.cleanup()
+        engine.uninit()
+
+
+class TestCommandWorker:
+    def test_drain_is_bounded_per_tick(self):
+        engine = MiniaudioEngine()
+        worker = CommandWorker(engine, BytesCache(lambda name: b""))
+        extra = 10
+        for i in range(CommandWorker.MAX_COMMANDS_PER_TICK + extra):
+            worker.submit({"command": "stop", "id": f"s{i}"})
+        worker._wake.clear()
+
+        worker._process_commands()
+        assert len(worker._pending) == extra
+        assert worker._wake.is_set()
+
+        worker._process_commands()
+        assert not worker._pending
+        engine.uninit()
+
+    @staticmethod
+    def _rendered_levels(volume, blocks=30, **source):
+        """Play a 441 Hz square wave, ticking the worker every 10ms; mean |L|+|R| per tick."""
+        import struct
+
+        engine = MiniaudioEngine(no_device=True)
+        # no_device still opens a device, whose thread would advance the
+        # engine clock between reads
+        engine.stop()
+        worker = CommandWorker(engine, BytesCache(lambda name: b""))
+        worker._process_single_command({
+            "command": "patch",
+            "id": "tone",
+            "source": {"kind": "waveform", "waveform": "square", "frequency": 441, **source},
+            "volume": volume,
+        })
+        levels = []
+        for _ in range(blocks):
+            if worker._ticking:
+                worker._update_sounds(engine.get_time_frames())
+            data = engine.read_frames(441)
+            samples = struct.unpack(f"{len(data) // 4}f", data)
+            levels.append(sum(abs(x) for x in samples) / 441)
+        worker.stop()
+        engine.uninit()
+        return levels
+
+    def test_volume_law_matches_across_paths(self):
+        # Static volumes, ticked envelopes and native ramps all play at
+        # exactly the requested volume
+        full = self._rendered_levels(1.0)[-1]
+        assert self._rendered_levels(0.5)[-1] == pytest.approx(0.5 * full, rel=0.01)
+        envelope = [
+            {"time": 0.0, "value": 0.5},
+            {"time": 0.1, "value": 0.25},
+            {"time": 1.0, "value": 0.25},
+        ]
+        assert self._rendered_levels(envelope)[-1] == pytest.approx(0.25 * full, rel=0.01)
+        ramp = [{"time": 0.0, "value": 0.0}, {"time": 0.1, "value": 0.5}]
+        assert self._rendered_levels(ramp)[-1] == pytest.approx(0.5 * full, rel=0.01)
+
+    def test_envelope_fades_on_from_initial_volume(self):
+        # Creation sets the envelope's starting volume instantly; updates
+        # (including the first) fade on from there rather than from 1
+        full = self._rendered_levels(1.0, blocks=4)
+        envelope = [
+            {"time": 0.0, "value": 0.5},
+            {"time": 0.1, "value": 0.25},
+            {"time": 1.0, "value": 0.25},
+        ]
+        levels = self._rendered_levels(envelope, blocks=4)
+        assert levels[0] == pytest.approx(0.5 * full[0], rel=0.01)
+        assert 0.45 * full[3] < levels[3] < levels[0]
+
+    def test_fade_out_scales_volume(self):
+        source = {"non_looping_duration": 1.0, "fade_out": 0.5}
+        full = self._rendered_levels(1.0, blocks=80, **source)
+        half = self._rendered_levels(0.5, blocks=80, **source)
+        # Halfway through the fade-out, it is still scaling the volume
+        assert full[75] < 0.6 * full[20]
+        for i in (20, 75):
+            assert half[i] == pytest.approx(0.5 * full[i], rel=0.01)
+
+    def test_linear_volume_ramp_runs_natively(self):
+        import struct
+
+        engine = MiniaudioEngine(no_device=True)
+        engine.stop()  # Render offline only, see _rendered_levels
+        worker = CommandWorker(engine, BytesCache(lambda name: b""))
+        worker._process_single_command({
+            "command": "patch",
+            "id": "ramp",
+            "source": {"kind": "waveform", "waveform": "square", "frequency": 441},
+            "volume": [{"time": 0, "value": 0}, {"time": 0.1, "value": 1}],
+        })
+        # Nothing left for the worker to tick
+        assert worker._sounds["ramp"]._constant
+
+        data = engine.read_frames(8820)
+        samples = struct.unpack(f"{len(data) // 4}f", data)
+        level = [abs(samples[2 * i]) + abs(samples[2 * i + 1]) for i in (1000, 2205, 6000)]
+        assert level[0] < level[1] < level[2]
+        assert level[1] == pytest.approx(level[2] / 2, rel=0.05)
+
+        worker.stop()
+        engine.uninit()
+
+    def test_patch_keeps_native_ramp_only_when_unchanged(self):
+        engine = MiniaudioEngine(no_device=True)
+        worker = CommandWorker(engine, BytesCache(lambda name: b""))
+        patch = {
+            "command": "patch",
+            "id": "ramp",
+            "source": {"kind": "waveform", "waveform": "square", "frequency": 441},
+            "volume": [{"time": 0, "value": 0}, {"time": 0.1, "value": 1}],
+        }
+        worker._process_single_command(patch)
+        worker._process_single_command(dict(patch, pan=0.5))
+        assert worker._sounds["ramp"].native_volume
+
+        worker._process_single_command(dict(patch, volume=[{"time": 0, "value": 0}, {"time": 0.2, "value": 1}]))
+        assert not worker._sounds["ramp"].native_volume
+
+        worker.stop()
+        engine.uninit()
+
+    def test_nested_compound_runs_in_order(self):
+        engine = MiniaudioEngine(no_device=True)
+        worker = CommandWorker(engine, BytesCache(lambda name: b""))
+        patch = parse_command({
+            "command": "patch",
+            "id": "tone",
+            "source": {"kind": "waveform", "waveform": "sine", "frequency": 440},
+        })
+        cmd = CompoundCommand(commands=(patch, StopCommand(id="tone")))
+        for _ in range(sys.getrecursionlimit()):
+            cmd = CompoundCommand(commands=(cmd,))
+        worker._execute_command(CompoundCommand(commands=(cmd, patch)))
+        assert set(worker._sounds) == {"tone"}
+
+        worker.stop()
+        engine.uninit()
+
+    def test_idle_sounds_are_not_ticked(self):
+        engine = MiniaudioEngine(no_device=True)
+        worker = CommandWorker(engine, BytesCache(lambda name: b""))
+        patch = {
+            "command": "patch",
+            "id": "tone",
+            "source": {"kind": "waveform", "waveform": "sine", "frequency": 440},
+        }
+        worker._process_single_command(patch)
+        worker._update_sounds(engine.get_time_frames())
+        assert "tone" not in worker._ticking
+
+        # New parameters put it back until they settle
+        patch["volume"] = [{"time": 0, "value": 1}, {"time": 1, "value": 0}]
+        worker._process_single_command(patch)
+        worker._update_sounds(engine.get_time_frames())
+        assert "tone" in worker._ticking
+
+        worker._process_single_command({"command": "stop", "id": "tone"})
+        assert not worker._ticking
+
+        worker.stop()
+        engine.uninit()
+
+    def test_scheduled_stop_cleaned_up_when_due(self):
+        engine = MiniaudioEngine(no_device=True)
+        worker = CommandWorker(engine, BytesCache(lambda name: b""))
+        worker._process_single_command({
+            "command": "patch",
+            "id": "blip",
+            "source": {
+                "kind": "waveform",
+                "waveform": "sine",
+                "frequency": 440,
+                "non_looping_duration": 0.1,
+                "fade_out": 0.05,
+            },
+        })
+        stop_frame = worker._sounds["blip"].scheduled_stop_frame
+        assert worker._stop_heap == [(stop_frame, "blip")]
+
+        worker._cleanup_finished(stop_frame - 1)
+        assert "blip" in worker._sounds
+        worker._cleanup_finished(stop_frame)
+        assert "blip" not in worker._sounds
+        assert not worker._stop_heap
+
+        worker.stop()
+        engine.uninit()
+
+    def test_prepared_command_skips_parsing(self, monkeypatch):
+        import fa_launcher_audio._internals.worker as worker_module
+
+        engine = MiniaudioEngine(no_device=True)
+        worker = CommandWorker(engine, BytesCache(lambda name: b""))
+        cmd = AudioManager.prepare_command({
+            "command": "patch",
+            "id": "tone",
+            "source": {"kind": "waveform", "waveform": "sine", "frequency": 440},
+        })
+        monkeypatch.setattr(worker_module, "prepare_command", None)
+        worker.submit(cmd)
+        worker._process_commands()
+        assert set(worker._sounds) == {"tone"}
+
+        worker.stop()
+        engine.uninit()
+
+    def test_encoded_bytes_stream_until_decoded(self, mock_bytes_callback):
+        calls = []
+
+        def provider(name):
+            calls.append(name)
+            return mock_bytes_callback(name)
+
+        engine = MiniaudioEngine(no_device=True)
+        bytes_cache = BytesCache(provider)
+        worker = CommandWorker(engine, bytes_cache)
+        patch = {
+            "command": "patch",
+            "id": "a",
+            "source": {"kind": "encoded_bytes", "name": "test.flac"},
+        }
+        # A miss streams, while the preload thread decodes for later plays
+        worker._process_single_command(patch)
+        assert isinstance(worker._sounds["a"].sound._source, DecoderSource)
+        worker._decoding["test.flac"].result(timeout=5)
+        worker._process_commands()
+        assert not worker._decoding
+
+        for sound_id in ("b", "c"):
+            worker._process_single_command({**patch, "id": sound_id})
+        assert calls == ["test.flac"]
+        assert worker._sounds["b"].sound._source._pcm is worker._sounds["c"].sound._source._pcm
+        # Only the decoded copy is kept
+        assert bytes_cache._total_bytes == 0
+
+        worker.stop()
+        engine.uninit()
+
+    def test_no_pcm_budget_always_streams(self, mock_bytes_callback):
+        engine = MiniaudioEngine(no_device=True)
+        worker = CommandWorker(engine, BytesCache(mock_bytes_callback), pcm_cache_max_bytes=0)
+        for sound_id in ("a", "b"):
+            worker._process_single_command({
+                "command": "patch",
+                "id": sound_id,
+                "source": {"kind": "encoded_bytes", "name": "test.flac"},
+            })
+            assert isinstance(worker._sounds[sound_id].sound._source, DecoderSource)
+        assert not worker._decoding
+
+        worker.stop()
+        engine.uninit()
+
+    def test_oversized_pcm_decoded_once_then_streams(self, mock_bytes_callback):
+        engine = MiniaudioEngine(no_device=True)
+        worker = CommandWorker(engine, BytesCache(mock_bytes_callback), pcm_cache_max_bytes=1)
+        patch = {
+            "command": "patch",
+            "id": "a",
+            "source": {"kind": "encoded_bytes", "name": "test.flac"},
+        }
+        worker._process_single_command(patch)
+        worker._decoding["test.flac"].result(timeout=5)
+        worker._process_commands()
+        assert worker._uncacheable == {"test.flac"}
+
+        worker._process_single_command({**patch, "id": "b"})
+        assert isinstance(worker._sounds["b"].sound._source, DecoderSource)
+        assert not worker._decoding
+
+        worker.stop()
+        engine.uninit()
+
+    def test_preloaded_audio_is_cached_by_worker(self, mock_bytes_callback):
+        calls = []
+
+        def provider(name):
+            calls.append(name)
+            return mock_bytes_callback(name)
+
+        engine = MiniaudioEngine(no_device=True)
+        worker = CommandWorker(engine, BytesCache(provider))
+        worker.preload("test.flac").result(timeout=5)
+        assert worker._wake.is_set()
+
+        worker._process_commands()
+        assert not worker._preloaded
+        pcm = worker._pcm_cache.get("test.flac")
+        worker._process_single_command({
+            "command": "patch",
+            "id": "a",
+            "source": {"kind": "encoded_bytes", "name": "test.flac"},
+        })
+        assert calls == ["test.flac"]
+        assert worker._sounds["a"].sound._source._pcm is pcm
+
+        worker.stop()
+        engine.uninit()
+
+    def test_finished_sounds_polled_natively(self, mock_bytes_callback):
+        engine = MiniaudioEngine(no_device=True)
+        worker = CommandWorker(engine, BytesCache(mock_bytes_callback))
+        worker._process_single_command({
+            "command": "patch",
+            "id": "short",
+            "source": {"kind": "encoded_bytes", "name": "short.wav"},
+        })
+        worker._process_single_command({
+            "command": "patch",
+            "id": "tone",
+            "source": {"kind": "waveform", "waveform": "sine", "frequency": 440},
+        })
+
+        worker._cleanup_finished(engine.get_time_frames())
+        assert set(worker._sounds) == {"short", "tone"}
+
+        # The silent WAV is 100ms long
+        engine.read_frames(engine.sample_rate // 5)
+        worker._cleanup_finished(engine.get_time_frames())
+        assert set(worker._sounds) == {"tone"}
+
+        worker.stop()
+        engine.uninit()
+
 
 class TestAudioManager:
     def test_manager_context_manager(self, mock_bytes_callback):
@@ -134,6 +718,8 @@ class TestAudioManager:
         mgr = AudioManager(data_provider=mock_bytes_callback)
         with pytest.raises(RuntimeError, match="not started"):
             mgr.submit_command({"command": "stop", "id": "test"})
+        with pytest.raises(RuntimeError, match="not started"):
+            mgr.preload("test.flac")
 
     def test_manager_compound(self, mock_bytes_callback):
         with AudioManager(data_provider=mock_bytes_callback) as mgr:
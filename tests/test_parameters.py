@@ -29,6 +29,17 @@ class TestTimeEnvelope:
         assert env.get_value(0.0) == 1.0
         assert env.get_value(100.0) == 1.0
 
+    def test_equal_values_are_constant(self):
+        env = TimeEnvelope([TimePoint(0.0, 0.5), TimePoint(1.0, 0.5, "jump")])
+        assert env.is_constant() is True
+        assert TimeEnvelope([TimePoint(0.0, 0.5), TimePoint(1.0, 0.6)]).is_constant() is False
+
+    def test_linear_ramp(self):
+        env = TimeEnvelope([TimePoint(0.0, 0.0), TimePoint(2.0, 1.0)])
+        assert env.linear_ramp() == (0.0, 1.0, 2.0)
+        assert TimeEnvelope([TimePoint(0.5, 0.0), TimePoint(2.0, 1.0)]).linear_ramp() is None
+        assert TimeEnvelope([TimePoint(0.0, 0.0), TimePoint(2.0, 1.0, "jump")]).linear_ramp() is None
+
     def test_before_first_point_returns_first_value(self):
         env = TimeEnvelope([
             TimePoint(1.0, 0.5),
@@ -78,6 +89,16 @@ class TestTimeEnvelope:
         assert env.get_value(1.5) == pytest.approx(0.75)
         assert env.get_value(2.0) == pytest.approx(0.5)
 
+    def test_out_of_order_queries(self):
+        env = TimeEnvelope([
+            TimePoint(0.0, 0.0),
+            TimePoint(1.0, 1.0),
+            TimePoint(2.0, 0.0),
+            TimePoint(3.0, 1.0),
+        ])
+        for t, expected in [(0.5, 0.5), (1.5, 0.5), (2.25, 0.25), (0.25, 0.25), (2.75, 0.75), (1.0, 1.0)]:
+            assert env.get_value(t) == pytest.approx(expected)
+
     def test_points_sorted_automatically(self):
         # Points given out of order
         env = TimeEnvelope([
@@ -105,6 +126,9 @@ class TestParseParam:
         assert isinstance(param, StaticParam)
         assert param.get_value(0) == 0.75
 
+    def test_parse_common_constant_is_shared(self):
+        assert parse_param(1) is parse_param(1.0)
+
     def test_parse_envelope(self):
         param = parse_param([
             {"time": 0.0, "value": 0.0},
@@ -128,6 +152,12 @@ class TestVolumeParams:
         assert params.volume.get_value(0) == 1.0
         assert params.pan.get_value(0) == 0.0
 
+    def test_from_dict_defaults_are_shared(self):
+        first = VolumeParams.from_dict({})
+        second = VolumeParams.from_dict({})
+        assert first.volume is second.volume
+        assert first.pan is second.pan
+
     def test_from_dict_static(self):
         params = VolumeParams.from_dict({
             "volume": 0.5,
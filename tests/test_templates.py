@@ -0,0 +1,56 @@
+"""Tests for command templates."""
+
+import pytest
+from fa_launcher_audio._internals.templates import compile_template
+
+
+TEMPLATE = {
+    "command": "patch",
+    "id": "$id",
+    "source": {"kind": "waveform", "waveform": "sine", "frequency": "$freq"},
+    "pan": [{"time": 0.0, "value": "$pan"}],
+    "lpf": {"cutoff": 1000.0},
+}
+
+
+class TestCompileTemplate:
+    def test_fills_slots(self):
+        fill = compile_template(TEMPLATE)
+        cmd = fill(id="ping", freq=440, pan=-1.0)
+        assert cmd["id"] == "ping"
+        assert cmd["source"] == {"kind": "waveform", "waveform": "sine", "frequency": 440}
+        assert cmd["pan"] == [{"time": 0.0, "value": -1.0}]
+
+    def test_template_not_modified(self):
+        fill = compile_template(TEMPLATE)
+        fill(id="ping", freq=440, pan=0.0)
+        assert TEMPLATE["source"]["frequency"] == "$freq"
+
+    def test_subtrees_without_slots_are_shared(self):
+        fill = compile_template(TEMPLATE)
+        assert fill(id="a", freq=1, pan=0.0)["lpf"] is fill(id="b", freq=2, pan=0.0)["lpf"]
+
+    def test_later_template_changes_not_seen(self):
+        template = {"command": "stop", "id": "$id", "extra": {"nested": [1, 2]}}
+        fill = compile_template(template)
+        template["extra"]["nested"].append(3)
+        template["command"] = "patch"
+        assert fill(id="a") == {"command": "stop", "id": "a", "extra": {"nested": [1, 2]}}
+
+    def test_double_dollar_is_literal(self):
+        fill = compile_template({
+            "command": "patch",
+            "id": "$id",
+            "source": {"kind": "encoded_bytes", "name": "$$coin.ogg"},
+        })
+        assert fill(id="a")["source"]["name"] == "$coin.ogg"
+
+    def test_missing_value_raises(self):
+        fill = compile_template(TEMPLATE)
+        with pytest.raises(TypeError, match="missing"):
+            fill(id="ping", freq=440)
+
+    def test_unknown_value_raises(self):
+        fill = compile_template(TEMPLATE)
+        with pytest.raises(TypeError, match="Unknown"):
+            fill(id="ping", freq=440, pan=0.0, volume=1.0)